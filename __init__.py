@@ -13,6 +13,8 @@ import bpy
 from .gui.main import (
     ROUTE2WORLD_PT_Main,
     ROUTE2WORLD_PT_Step1Generate,
+    ROUTE2WORLD_PT_Step1Terrain,
+    ROUTE2WORLD_PT_Step1Road,
     ROUTE2WORLD_PT_Step2Textures,
     ROUTE2WORLD_PT_Step3PostProcess,
     Route2WorldProperties,
@@ -24,7 +26,14 @@ from .app.ops import (
 )
 from .postprocess.terrain_transition import ROUTE2WORLD_OT_ApplyTerrainTransition
 from .scatter.ops import ROUTE2WORLD_OT_ScatterRoadsideAssets
-from .gui.scatter import ROUTE2WORLD_PT_Procedural, Route2WorldScatterProperties
+from .gui.scatter import (
+    ROUTE2WORLD_PT_Procedural,
+    ROUTE2WORLD_PT_ScatterBuildings,
+    ROUTE2WORLD_PT_ScatterGrass,
+    ROUTE2WORLD_PT_ScatterTrees,
+    Route2WorldScatterProperties,
+)
+from .gui import translations as _translations
 from .gui.translations import t
 
 
@@ -76,37 +85,58 @@ _classes = (
     ROUTE2WORLD_OT_ScatterRoadsideAssets,
     ROUTE2WORLD_PT_Main,
     ROUTE2WORLD_PT_Step1Generate,
+    ROUTE2WORLD_PT_Step1Terrain,
+    ROUTE2WORLD_PT_Step1Road,
     ROUTE2WORLD_PT_Step2Textures,
     ROUTE2WORLD_PT_Step3PostProcess,
     ROUTE2WORLD_PT_Procedural,
+    ROUTE2WORLD_PT_ScatterBuildings,
+    ROUTE2WORLD_PT_ScatterTrees,
+    ROUTE2WORLD_PT_ScatterGrass,
 )
 
+# Scenes already processed by the timer, keyed by scene.as_pointer(), so
+# re-registrations (e.g. on add-on reload) skip them in O(1).
+_assigned_scenes = set()
+
+
 def _ensure_default_targets():
+    # Objects are global to the blend file; look them up once, not per scene.
+    terrain_obj = bpy.data.objects.get("RWB_Terrain")
+    road_obj = bpy.data.objects.get("RWB_Road")
+    route_obj = bpy.data.objects.get("RWB_Route")
+    if terrain_obj is None and road_obj is None and route_obj is None:
+        return None
+
     for scene in bpy.data.scenes:
+        key = scene.as_pointer()
+        if key in _assigned_scenes:
+            continue
+
         p = getattr(scene, "route2world", None)
         if p is not None:
-            terrain_obj = bpy.data.objects.get("RWB_Terrain")
-            road_obj = bpy.data.objects.get("RWB_Road")
+            # Property group attributes always exist once registered, so
+            # plain attribute access is enough here.
             if terrain_obj is not None:
-                if getattr(p, "texture_terrain_obj", None) is None:
+                if p.texture_terrain_obj is None:
                     p.texture_terrain_obj = terrain_obj
-                if getattr(p, "terrain_transition_terrain_obj", None) is None:
+                if p.terrain_transition_terrain_obj is None:
                     p.terrain_transition_terrain_obj = terrain_obj
             if road_obj is not None:
-                if getattr(p, "texture_road_obj", None) is None:
+                if p.texture_road_obj is None:
                     p.texture_road_obj = road_obj
-                if getattr(p, "terrain_transition_road_obj", None) is None:
+                if p.terrain_transition_road_obj is None:
                     p.terrain_transition_road_obj = road_obj
 
         s = getattr(scene, "route2world_scatter", None)
         if s is not None:
-            route_obj = bpy.data.objects.get("RWB_Route")
-            terrain_obj = bpy.data.objects.get("RWB_Terrain")
-            if route_obj is not None and getattr(s, "route_object", None) is None:
+            if route_obj is not None and s.route_object is None:
                 s.route_object = route_obj
-            if terrain_obj is not None and getattr(s, "terrain_object", None) is None:
+            if terrain_obj is not None and s.terrain_object is None:
                 s.terrain_object = terrain_obj
 
+        _assigned_scenes.add(key)
+
     return None
 
 def _ensure_default_targets_timer():
@@ -118,6 +148,7 @@ def _ensure_default_targets_timer():
 
 
 def register():
+    _translations.register()
     for c in _classes:
         bpy.utils.register_class(c)
     bpy.types.Scene.route2world = bpy.props.PointerProperty(type=Route2WorldProperties)
@@ -129,7 +160,9 @@ def register():
 
 
 def unregister():
+    _assigned_scenes.clear()
     for c in reversed(_classes):
         bpy.utils.unregister_class(c)
     del bpy.types.Scene.route2world
     del bpy.types.Scene.route2world_scatter
+    _translations.unregister()
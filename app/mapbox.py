@@ -1,8 +1,11 @@
 import bpy
+import concurrent.futures
 import math
 import os
 import urllib.request
 import ssl
+from operator import attrgetter
+import numpy as np
 from mathutils import Vector
 from ..parse.gpx import GeoPoint
 
@@ -15,18 +18,22 @@ class MapboxTerrainDownloader:
         self.token = context.preferences.addons[package_name].preferences.mapbox_access_token
         self.ssl_context = ssl._create_unverified_context()
 
-    def deg2num(self, lat_deg, lon_deg, zoom):
-        lat_rad = math.radians(lat_deg)
+    # math.* bound as default args so calls use LOAD_FAST instead of
+    # re-resolving the module attribute each time
+    def deg2num(self, lat_deg, lon_deg, zoom,
+                _radians=math.radians, _asinh=math.asinh, _tan=math.tan, _pi=math.pi):
+        lat_rad = _radians(lat_deg)
         n = 2.0 ** zoom
         xtile = int((lon_deg + 180.0) / 360.0 * n)
-        ytile = int((1.0 - math.asinh(math.tan(lat_rad)) / math.pi) / 2.0 * n)
+        ytile = int((1.0 - _asinh(_tan(lat_rad)) / _pi) / 2.0 * n)
         return (xtile, ytile)
 
-    def num2deg(self, xtile, ytile, zoom):
+    def num2deg(self, xtile, ytile, zoom,
+                _atan=math.atan, _sinh=math.sinh, _pi=math.pi, _degrees=math.degrees):
         n = 2.0 ** zoom
         lon_deg = xtile / n * 360.0 - 180.0
-        lat_rad = math.atan(math.sinh(math.pi * (1 - 2 * ytile / n)))
-        lat_deg = math.degrees(lat_rad)
+        lat_rad = _atan(_sinh(_pi * (1 - 2 * ytile / n)))
+        lat_deg = _degrees(lat_rad)
         return (lat_deg, lon_deg)
 
     def download_and_create_terrain(self, gpx_points, quality="MEDIUM"):
@@ -37,8 +44,8 @@ class MapboxTerrainDownloader:
             return None
 
         # Determine Bounds
-        lats = [p.lat for p in gpx_points]
-        lons = [p.lon for p in gpx_points]
+        lats = list(map(attrgetter("lat"), gpx_points))
+        lons = list(map(attrgetter("lon"), gpx_points))
         min_lat, max_lat = min(lats), max(lats)
         min_lon, max_lon = min(lons), max(lons)
 
@@ -52,13 +59,6 @@ class MapboxTerrainDownloader:
         lon0_rad = math.radians(lon0)
         cos_lat0 = math.cos(lat0_rad)
 
-        def project(lat, lon):
-            lat_rad = math.radians(lat)
-            lon_rad = math.radians(lon)
-            x = (lon_rad - lon0_rad) * cos_lat0 * EARTH_RADIUS_M
-            y = (lat_rad - lat0_rad) * EARTH_RADIUS_M
-            return x, y
-
         # Add margin (approx 500m)
         margin_deg = 0.005
         min_lat -= margin_deg
@@ -79,6 +79,14 @@ class MapboxTerrainDownloader:
         start_x, end_x = min(t_min_x, t_max_x), max(t_min_x, t_max_x)
         start_y, end_y = min(t_min_y, t_max_y), max(t_min_y, t_max_y)
 
+        # Reject degenerate bounds before requesting anything from Mapbox
+        n_tiles = (end_x - start_x + 1) * (end_y - start_y + 1)
+        if n_tiles > 256:
+            raise Exception(
+                f"Terrain area too large ({n_tiles} tiles). "
+                "Reduce the download quality or use a shorter track."
+            )
+
         # Download Tiles and Process
         # We will build a grid of vertices.
         # To keep it simple, we process row by row of TILES.
@@ -101,136 +109,149 @@ class MapboxTerrainDownloader:
              total_cols = (end_x - start_x + 1) * eff_tile_size
              total_rows = (end_y - start_y + 1) * eff_tile_size
         
-        verts = []
-        
         # Pre-calculate tile images to avoid re-reading
         tile_images = {}
-        
+        # Decoded heights per tile, indexed [row, col] with row 0 at the tile's top edge
+        tile_heights = {}
+
         print(f"Downloading tiles: X[{start_x}-{end_x}], Y[{start_y}-{end_y}], Zoom {zoom}")
-        
-        for tx in range(start_x, end_x + 1):
-            for ty in range(start_y, end_y + 1):
+
+        tile_coords = [(tx, ty) for tx in range(start_x, end_x + 1) for ty in range(start_y, end_y + 1)]
+
+        # Cache check; collect tiles that still need fetching.
+        # One listdir of the temp dir replaces a stat syscall per tile.
+        tempdir = bpy.app.tempdir
+        try:
+            existing = {f for f in os.listdir(tempdir) if f.startswith("mapbox_terrain_")}
+        except OSError:
+            existing = set()
+        tile_paths = {}
+        missing = []
+        for tx, ty in tile_coords:
+            filename = f"mapbox_terrain_{zoom}_{tx}_{ty}.png"
+            filepath = os.path.join(tempdir, filename)
+            tile_paths[(tx, ty)] = filepath
+            if filename not in existing:
                 url = f"https://api.mapbox.com/v4/mapbox.terrain-rgb/{zoom}/{tx}/{ty}.pngraw?access_token={self.token}"
-                try:
-                    filename = f"mapbox_terrain_{zoom}_{tx}_{ty}.png"
-                    filepath = os.path.join(bpy.app.tempdir, filename)
-                    
-                    # Cache check
-                    if not os.path.exists(filepath):
-                        with urllib.request.urlopen(url, context=self.ssl_context) as response, open(filepath, 'wb') as out_file:
-                            out_file.write(response.read())
-                    
-                    img = bpy.data.images.load(filepath)
-                    # Force reload to ensure pixels are available
-                    img.reload()
-                    tile_images[(tx, ty)] = img
-                except Exception as e:
-                    print(f"Failed to download/load tile {tx},{ty}: {e}")
-                    tile_images[(tx, ty)] = None
+                missing.append((tx, ty, url, filepath))
+
+        def _fetch(item):
+            _, _, url, filepath = item
+            with urllib.request.urlopen(url, context=self.ssl_context) as response, open(filepath, 'wb') as out_file:
+                out_file.write(response.read())
+
+        # Download in parallel; the HTTPS round-trips overlap because network
+        # I/O releases the GIL. Wall time drops from num_tiles * RTT to ~RTT.
+        if missing:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+                futures = {executor.submit(_fetch, m): (m[0], m[1]) for m in missing}
+                for fut in concurrent.futures.as_completed(futures):
+                    tx, ty = futures[fut]
+                    try:
+                        fut.result()
+                    except Exception as e:
+                        print(f"Failed to download tile {tx},{ty}: {e}")
+
+        # Load and decode on the main thread (Blender APIs are not thread-safe).
+        # foreach_get overwrites the buffer, so one allocation serves all tiles.
+        buf = np.empty(tile_size * tile_size * 4, dtype=np.float32)
+        for tx, ty in tile_coords:
+            try:
+                img = bpy.data.images.load(tile_paths[(tx, ty)])
+                # Treat as raw data so no gamma conversion happens on read,
+                # and keep RGB independent of the (opaque) alpha channel
+                img.colorspace_settings.name = 'Non-Color'
+                img.alpha_mode = 'CHANNEL_PACKED'
+                tile_images[(tx, ty)] = img
+
+                # Decode all 256x256 pixels in one NumPy pass instead of
+                # reading img.pixels one float at a time per vertex.
+                img.pixels.foreach_get(buf)
+                rgba = buf.reshape(tile_size, tile_size, 4)
+                # Blender images are bottom-left origin, Mapbox tiles top-left.
+                rgba = rgba[::-1]
+                # Recover the exact 8-bit channel values and decode in integer
+                # math, matching Mapbox's documented formula:
+                # height = -10000 + (R * 65536 + G * 256 + B) * 0.1
+                rgb = (rgba[..., :3] * 255.0 + 0.5).astype(np.int32)
+                packed = (rgb[..., 0] << 16) | (rgb[..., 1] << 8) | rgb[..., 2]
+                tile_heights[(tx, ty)] = (packed * 0.1 - 10000.0).astype(np.float32)
+            except Exception as e:
+                print(f"Failed to load tile {tx},{ty}: {e}")
+                tile_images[(tx, ty)] = None
 
         # Build Mesh
-        # We iterate logically over the whole grid
+        # We compute the whole grid at once instead of looping per vertex.
         # y goes from top to bottom (lat decreases)
         # x goes from left to right (lon increases)
-        
-        # We need to map grid (row, col) to (lat, lon)
-        # Mapbox Web Mercator projection
-        
-        def pixel_to_latlon(px, py, zoom):
-            # px, py are global pixel coordinates
-            n = 2.0 ** zoom
-            # 256 pixels per tile
-            lon_deg = (px / 256.0) / n * 360.0 - 180.0
-            lat_rad = math.atan(math.sinh(math.pi * (1 - 2 * (py / 256.0) / n)))
-            lat_deg = math.degrees(lat_rad)
-            return lat_deg, lon_deg
 
         # Global pixel offset
         global_offset_x = start_x * 256
         global_offset_y = start_y * 256
 
-        # Create vertices
-        for r in range(total_rows + 1): # +1 for edge
-            for c in range(total_cols + 1):
-                # Calculate global pixel coord (approximate for the vertex)
-                # Note: 'step' pixels per grid cell
-                gx = global_offset_x + c * step
-                gy = global_offset_y + r * step
-                
-                # Identify which tile this falls into
-                tx = int(gx // 256)
-                ty = int(gy // 256)
-                
-                # Local pixel in tile
-                lx = int(gx % 256)
-                ly = int(gy % 256)
-                
-                # Clamp for edge case
-                if lx >= 256: lx = 255
-                if ly >= 256: ly = 255
-                
-                img = tile_images.get((tx, ty))
-                height = 0.0
-                
-                if img:
-                    # Get pixel color
-                    # img.pixels is RGBA flat list, bottom-to-top usually?
-                    # Blender images are bottom-left origin?
-                    # Mapbox tiles are top-left origin.
-                    # So we need to flip Y for blender image lookup.
-                    # Blender Y = 255 - ly
-                    bly = 255 - ly
-                    idx = (bly * 256 + lx) * 4
-                    if idx + 2 < len(img.pixels):
-                        R = img.pixels[idx]
-                        G = img.pixels[idx+1]
-                        B = img.pixels[idx+2]
-                        # Decode: -10000 + ((R * 256 * 256 + G * 256 + B) * 0.1)
-                        # Blender colors are 0..1 (float), mapbox needs 0..255 (int)
-                        # But wait, Blender might apply color management (Gamma).
-                        # We should treat it as non-color data.
-                        # Ideally set img.colorspace_settings.name = 'Non-Color' before reading.
-                        
-                        # Assuming linear or we compensate.
-                        # R_int = int(R * 255.0 + 0.5)
-                        # G_int = int(G * 255.0 + 0.5)
-                        # B_int = int(B * 255.0 + 0.5)
-                        
-                        # However, img.pixels access is slow. 
-                        # But we are doing it in a loop.
-                        
-                        height = -10000 + ((R * 255 * 256 * 256 + G * 255 * 256 + B * 255) * 0.1)
-                
-                # Calc Lat/Lon
-                lat, lon = pixel_to_latlon(gx, gy, zoom)
-                
-                # Project to local
-                x, y = project(lat, lon)
-                verts.append(Vector((x, y, height)))
-
-        # Create Faces
-        faces = []
+        # Global pixel coordinates of every grid vertex ('step' pixels per cell,
+        # +1 row/col for the edge)
+        gx = global_offset_x + np.arange(total_cols + 1, dtype=np.float64) * step
+        gy = global_offset_y + np.arange(total_rows + 1, dtype=np.float64) * step
+        GX, GY = np.meshgrid(gx, gy)
+
+        # Map global pixel coords to (lat, lon) - Mapbox Web Mercator projection
+        n = 2.0 ** zoom
+        lon = (GX / 256.0) / n * 360.0 - 180.0
+        lat = np.degrees(np.arctan(np.sinh(np.pi * (1.0 - 2.0 * (GY / 256.0) / n))))
+
+        # Project to local meters (same equirectangular approximation as project())
+        X = (np.radians(lon) - lon0_rad) * cos_lat0 * EARTH_RADIUS_M
+        Y = (np.radians(lat) - lat0_rad) * EARTH_RADIUS_M
+
+        # Stitch the decoded tiles into one big height grid; vertex heights
+        # then become a strided slice instead of a per-vertex tile dispatch.
+        ntiles_x = end_x - start_x + 1
+        ntiles_y = end_y - start_y + 1
+        big = np.zeros((ntiles_y * tile_size + 1, ntiles_x * tile_size + 1), dtype=np.float32)
+        for (tx, ty), arr in tile_heights.items():
+            y0 = (ty - start_y) * tile_size
+            x0 = (tx - start_x) * tile_size
+            big[y0:y0 + tile_size, x0:x0 + tile_size] = arr
+
+        # Duplicate the last pixel row/col so the +1 edge vertices read
+        # in-bounds and no per-vertex clamping is needed.
+        big[-1, :-1] = big[-2, :-1]
+        big[:, -1] = big[:, -2]
+
+        Z = big[::step, ::step][:total_rows + 1, :total_cols + 1]
+
+        verts = np.stack([X, Y, Z], axis=-1).reshape(-1, 3)
+
+        # Create Faces (quad grid) as flat index arrays, same winding as before:
+        # (v0, below, below-right, right)
         width_verts = total_cols + 1
-        for r in range(total_rows):
-            for c in range(total_cols):
-                # Quad faces
-                v0 = r * width_verts + c
-                v1 = v0 + 1
-                v2 = (r + 1) * width_verts + (c + 1)
-                v3 = (r + 1) * width_verts + c
-                faces.append((v0, v3, v2, v1))
-
-        # Create Mesh Object
+        r_idx, c_idx = np.mgrid[0:total_rows, 0:total_cols]
+        v0 = (r_idx * width_verts + c_idx).ravel()
+        faces = np.stack([v0, v0 + width_verts, v0 + width_verts + 1, v0 + 1], axis=-1)
+
+        # Create Mesh Object with bulk foreach_set, much faster than
+        # from_pydata for large grids
+        num_verts = verts.shape[0]
+        num_faces = faces.shape[0]
         mesh = bpy.data.meshes.new("RWB_Terrain_Mapbox")
-        mesh.from_pydata(verts, [], faces)
-        mesh.update()
+        mesh.vertices.add(num_verts)
+        mesh.vertices.foreach_set("co", verts.ravel())
+        mesh.loops.add(num_faces * 4)
+        mesh.loops.foreach_set("vertex_index", faces.ravel())
+        mesh.polygons.add(num_faces)
+        mesh.polygons.foreach_set("loop_start", np.arange(0, num_faces * 4, 4, dtype=np.int32))
+        mesh.polygons.foreach_set("loop_total", np.full(num_faces, 4, dtype=np.int32))
+        mesh.update(calc_edges=True)
         
         obj = bpy.data.objects.new("RWB_Terrain", mesh)
         
-        # Cleanup images
-        for img in tile_images.values():
-            if img:
-                bpy.data.images.remove(img)
-                
+        # Cleanup images in one pass; batch_remove avoids rescanning the
+        # datablock user lists for every single remove
+        imgs = [img for img in tile_images.values() if img]
+        if imgs:
+            bpy.data.batch_remove(imgs)
+
+
         return obj
 
@@ -1,6 +1,7 @@
 import os
 
 import bpy
+import numpy as np
 
 from ..building.builder import (
     add_solidify,
@@ -13,10 +14,20 @@ from ..building.builder import (
     lower_terrain_under_road,
 )
 from ..parse.gpx import parse_gpx_track, project_to_local_meters, simplify_polyline_xy, smooth_polyline
+from ..gui.main import invalidate_texture_signature
 from ..material.manager import apply_textures_from_scene_settings, reset_textures_data
 from .mapbox import MapboxTerrainDownloader
 
 
+def _set_if_possible(owner, attr: str, value) -> None:
+    # Target properties may be missing on scenes saved with older add-on
+    # versions; ignore those quietly.
+    try:
+        setattr(owner, attr, value)
+    except Exception:
+        pass
+
+
 class ROUTE2WORLD_OT_GenerateFromGpx(bpy.types.Operator):
     bl_idname = "route2world.generate_from_gpx"
     bl_label = "Generate from GPX"
@@ -56,33 +67,25 @@ class ROUTE2WORLD_OT_GenerateFromGpx(bpy.types.Operator):
             max_points = int(max_points_by_detail[detail])
             if max_points < 2:
                 max_points = 2
-            cum = [0.0]
-            for i in range(1, len(terrain_route)):
-                dx = float(terrain_route[i].x - terrain_route[i - 1].x)
-                dy = float(terrain_route[i].y - terrain_route[i - 1].y)
-                cum.append(cum[-1] + (dx * dx + dy * dy) ** 0.5)
+            pts = np.asarray([(p.x, p.y) for p in terrain_route], dtype=np.float64)
+            seg = np.linalg.norm(np.diff(pts, axis=0), axis=1)
+            cum = np.concatenate(([0.0], np.cumsum(seg)))
             total = float(cum[-1])
             if total <= 1e-6:
                 terrain_route = [terrain_route[0], terrain_route[-1]]
             else:
-                step = total / float(max_points - 1)
-                sampled = [terrain_route[0]]
-                target = step
-                j = 1
-                while len(sampled) < max_points - 1 and j < len(terrain_route) - 1:
-                    while j < len(cum) - 1 and cum[j] < target:
-                        j += 1
-                    if j >= len(terrain_route) - 1:
-                        break
-                    sampled.append(terrain_route[j])
-                    target += step
-                sampled.append(terrain_route[-1])
-                terrain_route = sampled
+                # Resample at evenly spaced arc lengths via binary search
+                targets = np.linspace(0.0, total, max_points)
+                idx = np.minimum(np.searchsorted(cum, targets), len(terrain_route) - 1)
+                idx[0] = 0
+                idx[-1] = len(terrain_route) - 1
+                terrain_route = [terrain_route[i] for i in idx]
 
         collection = ensure_collection("Route2World")
 
         terrain_obj = None
         road_obj = None
+        route_obj = None
         if p.create_terrain:
             if p.process_mode == "MAPBOX":
                 try:
@@ -91,8 +94,6 @@ class ROUTE2WORLD_OT_GenerateFromGpx(bpy.types.Operator):
                     pkg_name = __package__.split('.')[0]
                     quality = context.preferences.addons[pkg_name].preferences.download_quality
                     terrain_obj = downloader.download_and_create_terrain(geo_points, quality=quality)
-                    if terrain_obj:
-                        collection.objects.link(terrain_obj)
                 except Exception as e:
                     self.report({"ERROR"}, f"Mapbox Error: {e}")
                     return {"CANCELLED"}
@@ -108,62 +109,51 @@ class ROUTE2WORLD_OT_GenerateFromGpx(bpy.types.Operator):
                     seed=p.seed,
                     road_embed_m=p.road_embed_m,
                 )
-                collection.objects.link(terrain_obj)
 
-        route_obj = None
         if p.create_route_curve:
             route_obj = create_route_curve("RWB_Route", route_raw)
-            collection.objects.link(route_obj)
 
         if p.create_road_mesh:
             road_obj = create_road_mesh("RWB_Road", route_raw, p.road_width_m)
-            collection.objects.link(road_obj)
+
+        # Link everything in one batch so the depsgraph update runs once
+        # instead of once per object.
+        for obj in (terrain_obj, route_obj, road_obj):
+            if obj is not None:
+                collection.objects.link(obj)
+
+        if road_obj is not None:
             road_obj.location.z += float(p.road_offset_m)
             level_road_crossfall(road_obj, route_raw, p.road_width_m)
             add_solidify(road_obj, p.road_thickness_m)
 
+        road_for_terrain = None
         if terrain_obj is not None:
             road_for_terrain = road_obj or bpy.data.objects.get("RWB_Road")
             if road_for_terrain is not None:
                 lower_terrain_under_road(terrain_obj, road_for_terrain)
 
+        # Fall back to objects from a previous run for the target
+        # properties below, reusing the lookup already done above.
         if terrain_obj is None:
             terrain_obj = bpy.data.objects.get("RWB_Terrain")
         if road_obj is None:
-            road_obj = bpy.data.objects.get("RWB_Road")
+            road_obj = road_for_terrain or bpy.data.objects.get("RWB_Road")
         if route_obj is None:
             route_obj = bpy.data.objects.get("RWB_Route")
 
         if terrain_obj is not None:
-            try:
-                p.texture_terrain_obj = terrain_obj
-            except Exception:
-                pass
-            try:
-                p.terrain_transition_terrain_obj = terrain_obj
-            except Exception:
-                pass
+            _set_if_possible(p, "texture_terrain_obj", terrain_obj)
+            _set_if_possible(p, "terrain_transition_terrain_obj", terrain_obj)
             if s is not None:
-                try:
-                    s.terrain_object = terrain_obj
-                except Exception:
-                    pass
+                _set_if_possible(s, "terrain_object", terrain_obj)
 
         if road_obj is not None:
-            try:
-                p.texture_road_obj = road_obj
-            except Exception:
-                pass
-            try:
-                p.terrain_transition_road_obj = road_obj
-            except Exception:
-                pass
+            _set_if_possible(p, "texture_road_obj", road_obj)
+            _set_if_possible(p, "terrain_transition_road_obj", road_obj)
 
         if route_obj is not None and s is not None:
-            try:
-                s.route_object = route_obj
-            except Exception:
-                pass
+            _set_if_possible(s, "route_object", route_obj)
 
         return {"FINISHED"}
 
@@ -175,8 +165,10 @@ class ROUTE2WORLD_OT_ApplyTextures(bpy.types.Operator):
 
     def execute(self, context):
         p = context.scene.route2world
-        terrain_obj = getattr(p, "texture_terrain_obj", None) or bpy.data.objects.get("RWB_Terrain")
-        road_obj = getattr(p, "texture_road_obj", None) or bpy.data.objects.get("RWB_Road")
+        # Pointer properties first; the name scan only covers scenes that
+        # predate them.
+        terrain_obj = p.texture_terrain_obj or bpy.data.objects.get("RWB_Terrain")
+        road_obj = p.texture_road_obj or bpy.data.objects.get("RWB_Road")
         if terrain_obj is None and road_obj is None:
             self.report({"ERROR"}, "Terrain/Road not found (set Targets or create RWB_Terrain/RWB_Road)")
             return {"CANCELLED"}
@@ -196,5 +188,9 @@ class ROUTE2WORLD_OT_ResetTextures(bpy.types.Operator):
         p = context.scene.route2world
         root = str(getattr(p, "texture_root_dir", "") or "")
         msg = reset_textures_data(texture_root=root)
+        # The materials the debounce signature describes are gone now;
+        # without this, re-applying the same property values would be
+        # skipped as a no-op.
+        invalidate_texture_signature()
         self.report({"INFO"}, str(msg))
         return {"FINISHED"}
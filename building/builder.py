@@ -1,18 +1,28 @@
 from __future__ import annotations
 
+import concurrent.futures
 import math
+import os
 
 import bpy
-import bmesh
-from mathutils import Vector, noise
+import numpy as np
+from mathutils import Vector
 from mathutils.bvhtree import BVHTree
 
-from ..util.geom import Bounds2D, bounds_from_points_xy, lerp, smoothstep01
+from ..util.geom import Bounds2D, bounds_from_points_xy, lerp
 
 
 ROAD_UV_TILE_M = 6.0
 TERRAIN_UV_TILE_M = 5.0
 
+# Terrain presets keyed by the 1-5 detail level; built once at import so
+# create_terrain does not reconstruct the literals on every call.
+_RESOLUTION_BY_DETAIL = {1: 64, 2: 96, 3: 128, 4: 192, 5: 256}
+_MULTISCALE_ITERS_BY_DETAIL = {1: 2, 2: 3, 3: 3, 4: 4, 5: 5}
+_SCALE_DIVISOR_BY_DETAIL = {1: 32, 2: 32, 3: 32, 4: 16, 5: 16}
+_SLOPE_ITERS_BY_DETAIL = {1: 20, 2: 30, 3: 40, 4: 50, 5: 60}
+_SMOOTH_ITERS_BY_DETAIL = {1: 6, 2: 5, 3: 4, 4: 3, 5: 2}
+
 
 def ensure_collection(name: str) -> bpy.types.Collection:
     c = bpy.data.collections.get(name)
@@ -97,39 +107,68 @@ def lower_terrain_under_road(
     dir_down_l = (mwi_road.to_3x3() @ dir_down_w).normalized()
     dir_up_l = (mwi_road.to_3x3() @ dir_up_w).normalized()
 
-    moved = 0
-    for v in terrain_mesh.vertices:
-        co_w = mw_terrain @ v.co
-        x = float(co_w.x)
-        y = float(co_w.y)
-        if x < min_x or x > max_x or y < min_y or y > max_y:
-            continue
+    # Pull all terrain coordinates in one transfer and transform them to
+    # world space with a single matmul; the road bounding box then
+    # prefilters candidates as an array mask, so only vertices that can
+    # actually be under the road reach the per-ray loop below.
+    num_verts = len(terrain_mesh.vertices)
+    if num_verts == 0:
+        return 0
+    coords = np.empty(num_verts * 3, dtype=np.float64)
+    terrain_mesh.vertices.foreach_get("co", coords)
+    coords = coords.reshape(num_verts, 3)
+    m_terrain = np.asarray(mw_terrain, dtype=np.float64)
+    world = coords @ m_terrain[:3, :3].T + m_terrain[:3, 3]
+
+    inside = (
+        (world[:, 0] >= min_x)
+        & (world[:, 0] <= max_x)
+        & (world[:, 1] >= min_y)
+        & (world[:, 1] <= max_y)
+    )
+    candidates = np.nonzero(inside)[0]
+    if candidates.size == 0:
+        return 0
 
-        origin_above_w = Vector((x, y, origin_above_z))
-        origin_below_w = Vector((x, y, origin_below_z))
-        origin_above_l = mwi_road @ origin_above_w
-        origin_below_l = mwi_road @ origin_below_w
+    # Transform all candidate ray origins to road-local space in two
+    # matmuls; inside the loop only the raycasts go through mathutils.
+    # Hit/target heights need just the Z rows of the matrices, so those
+    # per-vertex full matrix multiplies reduce to scalar dot products.
+    m_inv_road = np.asarray(mwi_road, dtype=np.float64)
+    m_road = np.asarray(mw_road, dtype=np.float64)
+    m_inv_terrain = np.asarray(mwi_terrain, dtype=np.float64)
+    k = candidates.size
+    cand_xy = world[candidates, :2]
+    rot_t = m_inv_road[:3, :3].T
+    above_l = np.column_stack([cand_xy, np.full(k, origin_above_z)]) @ rot_t + m_inv_road[:3, 3]
+    below_l = np.column_stack([cand_xy, np.full(k, origin_below_z)]) @ rot_t + m_inv_road[:3, 3]
+    road_z = m_road[2]
+    terrain_z = m_inv_terrain[2]
 
-        hit_top = bvh.ray_cast(origin_above_l, dir_down_l, ray_len)
+    moved = 0
+    for ci in range(k):
+        hit_top = bvh.ray_cast(Vector(above_l[ci]), dir_down_l, ray_len)
         if hit_top is None or hit_top[0] is None:
             continue
-        loc_top_w = mw_road @ hit_top[0]
+        lt = hit_top[0]
+        ref_z = road_z[0] * lt.x + road_z[1] * lt.y + road_z[2] * lt.z + road_z[3]
 
-        hit_bot = bvh.ray_cast(origin_below_l, dir_up_l, ray_len)
-        loc_bot_w = None
+        hit_bot = bvh.ray_cast(Vector(below_l[ci]), dir_up_l, ray_len)
         if hit_bot is not None and hit_bot[0] is not None:
-            loc_bot_w = mw_road @ hit_bot[0]
-
-        ref_z = float(loc_top_w.z)
-        if loc_bot_w is not None:
-            ref_z = min(ref_z, float(loc_bot_w.z))
-
-        target_w = Vector((x, y, ref_z - clearance))
-        target_l = mwi_terrain @ target_w
-        if float(v.co.z) > float(target_l.z):
-            v.co.z = float(target_l.z)
+            lb = hit_bot[0]
+            bot_z = road_z[0] * lb.x + road_z[1] * lb.y + road_z[2] * lb.z + road_z[3]
+            ref_z = min(ref_z, bot_z)
+
+        x = cand_xy[ci, 0]
+        y = cand_xy[ci, 1]
+        target_z = terrain_z[0] * x + terrain_z[1] * y + terrain_z[2] * (ref_z - clearance) + terrain_z[3]
+        vi = candidates[ci]
+        if coords[vi, 2] > target_z:
+            coords[vi, 2] = target_z
             moved += 1
 
+    if moved:
+        terrain_mesh.vertices.foreach_set("co", coords.ravel())
     terrain_mesh.update()
     return moved
 
@@ -141,64 +180,78 @@ def create_route_curve(name: str, points: list[Vector]) -> bpy.types.Object:
 
     spline = curve.splines.new("POLY")
     spline.points.add(len(points) - 1)
-    for i, p in enumerate(points):
-        spline.points[i].co = (p.x, p.y, p.z, 1.0)
+    # POLY spline points take (x, y, z, w); upload them in one buffer
+    # instead of assigning .co per point.
+    co = np.empty((len(points), 4), dtype=np.float32)
+    co[:, :3] = np.asarray([(p.x, p.y, p.z) for p in points], dtype=np.float32)
+    co[:, 3] = 1.0
+    spline.points.foreach_set("co", co.ravel())
 
     return bpy.data.objects.new(name, curve)
 
 
 def create_road_mesh(name: str, points: list[Vector], width_m: float) -> bpy.types.Object:
-    bm = bmesh.new()
-    uv_layer = bm.loops.layers.uv.new("UVMap")
-
-    left: list[bmesh.types.BMVert] = []
-    right: list[bmesh.types.BMVert] = []
-
     half_w = width_m * 0.5
     tile = max(0.001, float(ROAD_UV_TILE_M))
     u0 = 0.0
     u1 = float(width_m) / tile
-    v_by_i: list[float] = [0.0]
-    for i in range(1, len(points)):
-        v_by_i.append(v_by_i[-1] + (points[i] - points[i - 1]).length / tile)
+    pts = np.asarray([(p.x, p.y, p.z) for p in points], dtype=np.float64)
+    seg_len = np.linalg.norm(np.diff(pts, axis=0), axis=1)
+    v_by_i = np.concatenate(([0.0], np.cumsum(seg_len / tile)))
 
+    # Central-difference tangents for the whole polyline at once, rotated
+    # 90 degrees into half-width offsets. Degenerate tangents fall back
+    # to +X, i.e. a +Y offset, matching the old scalar loop.
     n = len(points)
-    for i, p in enumerate(points):
-        p_prev = points[i - 1] if i > 0 else points[i]
-        p_next = points[i + 1] if i < n - 1 else points[i]
-        t = Vector((p_next.x - p_prev.x, p_next.y - p_prev.y, 0.0))
-        if t.length_squared <= 1e-12:
-            t = Vector((1.0, 0.0, 0.0))
-        t.normalize()
-        perp = Vector((-t.y, t.x, 0.0))
-        offset = perp * half_w
-
-        l = bm.verts.new(Vector((p.x, p.y, p.z)) + offset)
-        r = bm.verts.new(Vector((p.x, p.y, p.z)) - offset)
-        left.append(l)
-        right.append(r)
-
-    bm.verts.ensure_lookup_table()
-
-    for i in range(n - 1):
-        v1, v2, v3, v4 = left[i], right[i], right[i + 1], left[i + 1]
-        try:
-            f = bm.faces.new([v1, v2, v3, v4])
-            loops = f.loops
-            v0 = v_by_i[i]
-            v1v = v_by_i[i + 1]
-            loops[0][uv_layer].uv = (u0, v0)
-            loops[1][uv_layer].uv = (u1, v0)
-            loops[2][uv_layer].uv = (u1, v1v)
-            loops[3][uv_layer].uv = (u0, v1v)
-        except ValueError:
-            pass
-
-    bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
+    tang = np.empty((n, 2), dtype=np.float64)
+    tang[1:-1] = pts[2:, :2] - pts[:-2, :2]
+    tang[0] = pts[min(1, n - 1), :2] - pts[0, :2]
+    tang[-1] = pts[-1, :2] - pts[max(n - 2, 0), :2]
+    l2 = tang[:, 0] ** 2 + tang[:, 1] ** 2
+    degenerate = l2 <= 1e-12
+    inv = half_w / np.sqrt(np.where(degenerate, 1.0, l2))
+    offs = np.stack([-tang[:, 1] * inv, tang[:, 0] * inv], axis=-1)
+    offs[degenerate] = (0.0, half_w)
+
+    # Left vertex at 2i, right at 2i+1 — level_road_crossfall relies on
+    # this interleaving.
+    coords = np.empty((2 * n, 3), dtype=np.float32)
+    coords[0::2, :2] = pts[:, :2] + offs
+    coords[1::2, :2] = pts[:, :2] - offs
+    coords[0::2, 2] = pts[:, 2]
+    coords[1::2, 2] = pts[:, 2]
+
+    # One quad per segment, (left, right, right+1, left+1) winding as
+    # before so normals face +Z; bulk index buffers replace the per-face
+    # bm.faces.new try/except.
+    num_faces = max(0, n - 1)
+    fi = np.arange(num_faces)
+    quads = np.stack([2 * fi, 2 * fi + 1, 2 * fi + 3, 2 * fi + 2], axis=-1)
+    loop_verts = quads.ravel().astype(np.int32)
 
     mesh = bpy.data.meshes.new(name)
-    bm.to_mesh(mesh)
-    bm.free()
+    mesh.vertices.add(2 * n)
+    mesh.vertices.foreach_set("co", coords.ravel())
+    mesh.loops.add(num_faces * 4)
+    mesh.loops.foreach_set("vertex_index", loop_verts)
+    mesh.polygons.add(num_faces)
+    mesh.polygons.foreach_set("loop_start", np.arange(0, num_faces * 4, 4, dtype=np.int32))
+    mesh.polygons.foreach_set("loop_total", np.full(num_faces, 4, dtype=np.int32))
+
+    uv = np.empty((num_faces, 4, 2), dtype=np.float32)
+    uv[:, 0, 0] = u0
+    uv[:, 1, 0] = u1
+    uv[:, 2, 0] = u1
+    uv[:, 3, 0] = u0
+    uv[:, 0, 1] = v_by_i[:-1]
+    uv[:, 1, 1] = v_by_i[:-1]
+    uv[:, 2, 1] = v_by_i[1:]
+    uv[:, 3, 1] = v_by_i[1:]
+    uv_layer = mesh.uv_layers.new(name="UVMap")
+    uv_layer.data.foreach_set("uv", uv.ravel())
+
+    mesh.update(calc_edges=True)
+    mesh.validate()
     return bpy.data.objects.new(name, mesh)
 
 
@@ -242,139 +295,238 @@ def level_road_crossfall(
     max_bank = max(0.0, float(max_bank_slope_m_per_m))
     gain = float(bank_gain)
 
-    def curvature_at(i: int) -> float:
-        i0 = max(0, i - 1)
-        i1 = i
-        i2 = min(n - 1, i + 1)
-
-        p0 = route[i0]
-        p1 = route[i1]
-        p2 = route[i2]
-
-        a = Vector((p1.x - p0.x, p1.y - p0.y))
-        b = Vector((p2.x - p1.x, p2.y - p1.y))
-        la = float(a.length)
-        lb = float(b.length)
-        if la <= 1e-6 or lb <= 1e-6:
-            return 0.0
-
-        dot = float(a.x * b.x + a.y * b.y)
-        cross = float(a.x * b.y - a.y * b.x)
-        angle = math.atan2(cross, dot)
-        s = 0.5 * (la + lb)
-        if s <= 1e-6:
-            return 0.0
-        return angle / s
-
-    for i in range(n):
-        li = 2 * i
-        ri = li + 1
-        vl = mesh.vertices[li]
-        vr = mesh.vertices[ri]
-        zl = float(vl.co.z)
-        zr = float(vr.co.z)
-        z_avg = 0.5 * (zl + zr)
-
-        k = curvature_at(i)
-        bank = k * gain
-        if bank > max_bank:
-            bank = max_bank
-        elif bank < -max_bank:
-            bank = -max_bank
-        if abs(bank) < 0.002:
-            bank = 0.0
-
-        delta = bank * half_w
-        vl.co.z = z_avg - delta
-        vr.co.z = z_avg + delta
+    # 3-point curvature for all interior vertices in one pass; the
+    # endpoints have a degenerate fore/aft segment and stay at zero,
+    # matching the old per-vertex early-outs.
+    pts = np.asarray([(p.x, p.y) for p in route], dtype=np.float64)
+    a = pts[1:-1] - pts[:-2]
+    b = pts[2:] - pts[1:-1]
+    la = np.linalg.norm(a, axis=1)
+    lb = np.linalg.norm(b, axis=1)
+    dot = (a * b).sum(axis=1)
+    cross = a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0]
+    angle = np.arctan2(cross, dot)
+    s = 0.5 * (la + lb)
+    valid = (la > 1e-6) & (lb > 1e-6)
+    k = np.zeros(n, dtype=np.float64)
+    k[1:-1] = np.where(valid, angle / np.where(valid, s, 1.0), 0.0)
+
+    bank = np.clip(k * gain, -max_bank, max_bank)
+    bank[np.abs(bank) < 0.002] = 0.0
+    delta = bank * half_w
+
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    z = co[2::3]
+    z_avg = 0.5 * (z[0:expected:2] + z[1:expected:2])
+    z[0:expected:2] = z_avg - delta
+    z[1:expected:2] = z_avg + delta
+    mesh.vertices.foreach_set("co", co)
 
     mesh.update()
 
 
-def _nearest_route_distance_and_height_segment_xy(x: float, y: float, route: list[Vector]) -> tuple[float, float]:
-    best_d2 = float("inf")
-    best_h = route[0].z if route else 0.0
-
-    for i in range(len(route) - 1):
-        a = route[i]
-        b = route[i + 1]
-        ax = a.x
-        ay = a.y
-        bx = b.x
-        by = b.y
-        abx = bx - ax
-        aby = by - ay
-        denom = abx * abx + aby * aby
-        t = 0.0
-        if denom > 1e-12:
-            t = ((x - ax) * abx + (y - ay) * aby) / denom
-            if t < 0.0:
-                t = 0.0
-            elif t > 1.0:
-                t = 1.0
-        cx = ax + abx * t
-        cy = ay + aby * t
-        dx = x - cx
-        dy = y - cy
-        d2 = dx * dx + dy * dy
-        if d2 < best_d2:
-            best_d2 = d2
-            best_h = lerp(a.z, b.z, t)
-    return math.sqrt(best_d2), best_h
-
-
-def _bilinear_sample_height(
-    heights: list[float],
-    size: int,
-    x: float,
-    y: float,
-    bounds: Bounds2D,
-) -> float:
-    width = bounds.size_x
-    depth = bounds.size_y
-    if width <= 1e-12 or depth <= 1e-12:
-        return float(heights[0]) if heights else 0.0
-
-    u = (x - bounds.min_x) / width
-    v = (y - bounds.min_y) / depth
-    if u < 0.0:
-        u = 0.0
-    elif u > 1.0:
-        u = 1.0
-    if v < 0.0:
-        v = 0.0
-    elif v > 1.0:
-        v = 1.0
-
-    sx = u * (size - 1)
-    sy = v * (size - 1)
-    ix = int(math.floor(sx))
-    iy = int(math.floor(sy))
-    tx = sx - ix
-    ty = sy - iy
-
-    ix1 = ix + 1
-    iy1 = iy + 1
-    if ix1 >= size:
-        ix1 = size - 1
-    if iy1 >= size:
-        iy1 = size - 1
-
-    h00 = float(heights[ix + iy * size])
-    h10 = float(heights[ix1 + iy * size])
-    h01 = float(heights[ix + iy1 * size])
-    h11 = float(heights[ix1 + iy1 * size])
-
-    hx0 = lerp(h00, h10, tx)
-    hx1 = lerp(h01, h11, tx)
-    return lerp(hx0, hx1, ty)
-
-
-def _undulation_noise_2d(x: float, y: float, frequency: float) -> float:
+def _smoothstep01_np(t: np.ndarray) -> np.ndarray:
+    # Array counterpart of util.geom.smoothstep01; clips like the scalar
+    # form so callers can feed it unclamped ramps.
+    t = np.clip(t, 0.0, 1.0)
+    return t * t * (3.0 - 2.0 * t)
+
+
+def _lerp_np(a: np.ndarray, b: np.ndarray, t: np.ndarray) -> np.ndarray:
+    # Array counterpart of util.geom.lerp.
+    return a + (b - a) * t
+
+
+def _precompute_route_segments(route: list[Vector]) -> tuple[np.ndarray, ...]:
+    """Pack the route's segments into contiguous arrays for vectorized queries.
+
+    Returns (ax, ay, abx, aby, inv_denom, az, dz) where inv_denom is the
+    reciprocal of the squared segment length (0 for degenerate segments).
+    """
+    pts = np.asarray([(p.x, p.y, p.z) for p in route], dtype=np.float64)
+    if pts.shape[0] == 1:
+        pts = np.repeat(pts, 2, axis=0)
+    a = pts[:-1]
+    b = pts[1:]
+    abx = b[:, 0] - a[:, 0]
+    aby = b[:, 1] - a[:, 1]
+    denom = abx * abx + aby * aby
+    safe = denom > 1e-12
+    inv_denom = np.where(safe, 1.0 / np.where(safe, denom, 1.0), 0.0)
+    return a[:, 0], a[:, 1], abx, aby, inv_denom, a[:, 2], b[:, 2] - a[:, 2]
+
+
+def _nearest_route_d2_and_height(
+    X: np.ndarray,
+    Y: np.ndarray,
+    seg: tuple[np.ndarray, ...],
+    point_chunk: int = 4096,
+    seg_batch: int = 512,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Squared distance to the route and interpolated route height per grid point.
+
+    Points and segments are processed in chunks so the (points x segments)
+    temporaries stay a few MB regardless of grid and route size. Point chunks
+    are contiguous grid rows, i.e. spatially tight slabs, so each chunk visits
+    segments nearest-first (ordered by AABB distance lower bound) and stops
+    once that bound exceeds the chunk's worst current distance — most of a
+    long route is never evaluated against any given slab.
+    """
+    ax, ay, abx, aby, inv_denom, az, dz = seg
+    seg_xmin = np.minimum(ax, ax + abx)
+    seg_xmax = np.maximum(ax, ax + abx)
+    seg_ymin = np.minimum(ay, ay + aby)
+    seg_ymax = np.maximum(ay, ay + aby)
+
+    pts_x = X.ravel()
+    pts_y = Y.ravel()
+    n_pts = pts_x.size
+    n_seg = abx.size
+
+    out_d2 = np.full(n_pts, np.inf, dtype=np.float64)
+    out_h = np.full(n_pts, float(az[0]) if n_seg else 0.0, dtype=np.float64)
+
+    def _solve_chunk(p0: int) -> None:
+        p1 = min(n_pts, p0 + point_chunk)
+        px = pts_x[p0:p1, None]
+        py = pts_y[p0:p1, None]
+        best_d2 = out_d2[p0:p1]
+        best_h = out_h[p0:p1]
+        rows = np.arange(p1 - p0)
+
+        # Lower bound of distance from the chunk's bounding box to each
+        # segment's bounding box; visiting in that order makes the prune
+        # below kick in after the first few batches.
+        cx0 = px.min()
+        cx1 = px.max()
+        cy0 = py.min()
+        cy1 = py.max()
+        ddx = np.maximum(0.0, np.maximum(seg_xmin - cx1, cx0 - seg_xmax))
+        ddy = np.maximum(0.0, np.maximum(seg_ymin - cy1, cy0 - seg_ymax))
+        lb2 = ddx * ddx + ddy * ddy
+        order = np.argsort(lb2)
+        lb2_sorted = lb2[order]
+
+        for s0 in range(0, n_seg, seg_batch):
+            if s0 > 0 and lb2_sorted[s0] > best_d2.max():
+                break
+            s1 = min(n_seg, s0 + seg_batch)
+            idx = order[s0:s1]
+            t = ((px - ax[idx]) * abx[idx] + (py - ay[idx]) * aby[idx]) * inv_denom[idx]
+            np.clip(t, 0.0, 1.0, out=t)
+            dx = px - (ax[idx] + abx[idx] * t)
+            dy = py - (ay[idx] + aby[idx] * t)
+            d2 = dx * dx + dy * dy
+            j = np.argmin(d2, axis=1)
+            d2_min = d2[rows, j]
+            better = d2_min < best_d2
+            jb = idx[j[better]]
+            best_d2[better] = d2_min[better]
+            best_h[better] = az[jb] + dz[jb] * t[better, j[better]]
+
+    # Chunks write disjoint slices of the output, and NumPy releases the
+    # GIL inside the array kernels, so threading scales with cores.
+    starts = range(0, n_pts, point_chunk)
+    workers = min(8, os.cpu_count() or 1, len(starts))
+    if workers > 1:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(_solve_chunk, starts))
+    else:
+        for p0 in starts:
+            _solve_chunk(p0)
+
+    return out_d2.reshape(X.shape), out_h.reshape(X.shape)
+
+
+def _upsample_bilinear(heights: np.ndarray, src_size: int, dst_size: int) -> np.ndarray:
+    """Bilinear resample of a square grid to another resolution.
+
+    Source and destination grids span the same bounds, so the sample
+    coordinates are separable: one 1D index/weight pair per axis, reused for
+    rows and columns, instead of full 2D coordinate arrays per cell. Works
+    in both directions; the coarse levels reuse it to downsample the
+    route-distance fields.
+    """
+    if src_size < 2:
+        fill = float(heights.flat[0]) if heights.size else 0.0
+        return np.full((dst_size, dst_size), fill, dtype=np.float64)
+
+    s = np.linspace(0.0, src_size - 1.0, dst_size)
+    i0 = np.minimum(np.floor(s).astype(np.intp), src_size - 2)
+    i1 = i0 + 1
+    t = s - i0
+
+    grid = heights.reshape(src_size, src_size)
+    # Interpolate along x first (src_size rows), then along y on the result.
+    gx0 = grid[:, i0]
+    rows = gx0 + (grid[:, i1] - gx0) * t[None, :]
+    out0 = rows[i0, :]
+    return out0 + (rows[i1, :] - out0) * t[:, None]
+
+
+_NOISE_LATTICE_SIZE = 256
+_noise_lattice_cache: dict[int, np.ndarray] = {}
+
+
+def _undulation_lattice(seed: int) -> np.ndarray:
+    # Lattice of random unit gradient vectors, shape (N, N, 2).
+    lattice = _noise_lattice_cache.get(seed)
+    if lattice is None:
+        rng = np.random.default_rng(seed)
+        angle = rng.uniform(0.0, 2.0 * np.pi, (_NOISE_LATTICE_SIZE, _NOISE_LATTICE_SIZE))
+        lattice = np.stack([np.cos(angle), np.sin(angle)], axis=-1)
+        _noise_lattice_cache[seed] = lattice
+    return lattice
+
+
+def _undulation_noise_grid(
+    X: np.ndarray,
+    Y: np.ndarray,
+    frequency: float,
+    seed: int,
+) -> np.ndarray:
+    """Seeded gradient (Perlin-style) noise in roughly [-1, 1], whole grid.
+
+    Each cell interpolates the dot products of the four corner gradients
+    with the offset to the sample point, using smoothstep weights; this is
+    zero at lattice points and free of the blocky plateaus value noise
+    shows. Lattice coordinates wrap, so the pattern tiles every 256 noise
+    cells (far larger than any terrain at the frequencies used here).
+    """
     f = float(frequency)
     if f <= 0.0:
-        return 0.0
-    return noise.noise(Vector((x * f, y * f, 0.0)), noise_basis="PERLIN_ORIGINAL")
+        return np.zeros(X.shape, dtype=np.float64)
+
+    lattice = _undulation_lattice(int(seed))
+    gx = X * f
+    gy = Y * f
+    ix0 = np.floor(gx).astype(np.int64)
+    iy0 = np.floor(gy).astype(np.int64)
+    fx = gx - ix0
+    fy = gy - iy0
+    tx = _smoothstep01_np(fx)
+    ty = _smoothstep01_np(fy)
+
+    mask = _NOISE_LATTICE_SIZE - 1
+    ix0 &= mask
+    iy0 &= mask
+    ix1 = (ix0 + 1) & mask
+    iy1 = (iy0 + 1) & mask
+
+    g00 = lattice[iy0, ix0]
+    g10 = lattice[iy0, ix1]
+    g01 = lattice[iy1, ix0]
+    g11 = lattice[iy1, ix1]
+    n00 = g00[..., 0] * fx + g00[..., 1] * fy
+    n10 = g10[..., 0] * (fx - 1.0) + g10[..., 1] * fy
+    n01 = g01[..., 0] * fx + g01[..., 1] * (fy - 1.0)
+    n11 = g11[..., 0] * (fx - 1.0) + g11[..., 1] * (fy - 1.0)
+    out = _lerp_np(_lerp_np(n00, n10, tx), _lerp_np(n01, n11, tx), ty)
+    # Raw gradient noise peaks at ~±sqrt(2)/2; rescale so amplitude
+    # settings keep meaning "meters of undulation".
+    out *= math.sqrt(2.0)
+    return out
 
 
 def build_multiscale_heightmap(
@@ -390,7 +542,7 @@ def build_multiscale_heightmap(
     undulation_seed: int,
     carve_depth_m: float,
     carve_radius_m: float,
-) -> tuple[list[float], int, list[float]]:
+) -> tuple[np.ndarray, int, np.ndarray]:
     final_size = max(8, int(grid_resolution))
     coarse_size = max(8, int(math.floor(final_size / float(max(1, int(initial_scale_divisor))))))
     iter_cnt = max(1, int(multiscale_iterations))
@@ -404,156 +556,159 @@ def build_multiscale_heightmap(
     if sizes[-1] != final_size:
         sizes.append(final_size)
 
-    width = bounds.size_x
-    depth = bounds.size_y
+    if len(route) < 2:
+        n = final_size * final_size
+        z0 = float(route[0].z) if route else 0.0
+        return (
+            np.full(n, z0, dtype=np.float32),
+            final_size,
+            np.full(n, np.inf, dtype=np.float32),
+        )
+
+    noise_seed = int(undulation_seed) or 140230
 
-    noise.seed_set(int(undulation_seed) or 140230)
+    seg = _precompute_route_segments(route)
 
-    prev_heights: list[float] = []
+    prev_heights: np.ndarray | None = None
     prev_size = 0
-    final_distances: list[float] = []
 
     pin_r = max(0.0, float(pin_radius_m))
     blend_r = max(pin_r, float(route_blend_radius_m))
     carve_r = max(0.0, float(carve_radius_m))
     carve_d = max(0.0, float(carve_depth_m))
+    amp = float(undulation_amplitude_m)
+
+    # Divisions inside the loop become multiplications by reciprocals
+    # hoisted out here.
+    inv_carve_r = 1.0 / carve_r if carve_r > 0.0 else 0.0
+    inv_blend_span = 1.0 / max(blend_r - pin_r, 1e-6)
+    inv_blend_r = 1.0 / blend_r if blend_r > 0.0 else 0.0
+
+    # The route distance/height fields are scale-invariant, so solve them
+    # once on the finest grid and bilinearly downsample to each coarse
+    # level instead of rerunning the nearest-segment query per level.
+    xs_f = np.linspace(bounds.min_x, bounds.max_x, final_size)
+    ys_f = np.linspace(bounds.min_y, bounds.max_y, final_size)
+    X_f, Y_f = np.meshgrid(xs_f, ys_f)
+    d2_f, route_h_f = _nearest_route_d2_and_height(X_f, Y_f, seg)
+    nearest_d_f = np.sqrt(d2_f)
 
     for size in sizes:
-        heights = [0.0] * (size * size)
-        distances: list[float] | None = [0.0] * (size * size) if size == final_size else None
-        for iy in range(size):
-            fy = iy / float(size - 1)
-            y = bounds.min_y + fy * depth
-            for ix in range(size):
-                fx = ix / float(size - 1)
-                x = bounds.min_x + fx * width
-
-                if prev_size > 0:
-                    base_h = _bilinear_sample_height(prev_heights, prev_size, x, y, bounds)
-                else:
-                    _, base_h = _nearest_route_distance_and_height_segment_xy(x, y, route)
-
-                nearest_d, route_h = _nearest_route_distance_and_height_segment_xy(x, y, route)
-                if distances is not None:
-                    distances[ix + iy * size] = nearest_d
-
-                if carve_d > 0.0 and carve_r > 0.0 and nearest_d < carve_r:
-                    route_h -= carve_d * smoothstep01(1.0 - (nearest_d / carve_r))
-
-                h = base_h
-                if nearest_d <= pin_r:
-                    h = route_h
-                elif nearest_d <= blend_r:
-                    denom = max(blend_r - pin_r, 1e-6)
-                    t = (nearest_d - pin_r) / denom
-                    t = smoothstep01(t)
-                    h = lerp(route_h, base_h, t)
-
-                if undulation_amplitude_m > 0.0 and blend_r > 0.0:
-                    d_norm = (nearest_d - blend_r) / blend_r
-                    if d_norm < 0.0:
-                        d_norm = 0.0
-                    elif d_norm > 1.0:
-                        d_norm = 1.0
-                    s = smoothstep01(d_norm)
-                    h += _undulation_noise_2d(x, y, undulation_frequency) * float(undulation_amplitude_m) * s
-
-                heights[ix + iy * size] = h
-
-        prev_heights = heights
+        if size == final_size:
+            X, Y = X_f, Y_f
+            nearest_d = nearest_d_f
+            route_h = route_h_f
+        else:
+            xs = np.linspace(bounds.min_x, bounds.max_x, size)
+            ys = np.linspace(bounds.min_y, bounds.max_y, size)
+            X, Y = np.meshgrid(xs, ys)
+            nearest_d = _upsample_bilinear(nearest_d_f, final_size, size)
+            route_h = _upsample_bilinear(route_h_f, final_size, size)
+
+        if prev_size > 0:
+            base_h = _upsample_bilinear(prev_heights, prev_size, size)
+        else:
+            base_h = route_h.copy()
+
+        # Pin/blend/carve only ever changes cells inside blend_r, which is a
+        # thin band around the route; run that math on the compressed band
+        # instead of the whole grid and leave base heights alone elsewhere.
+        h = base_h
+        in_blend = nearest_d <= blend_r
+        if np.any(in_blend):
+            d_band = nearest_d[in_blend]
+            rh = route_h[in_blend]
+            if carve_d > 0.0 and carve_r > 0.0:
+                rh = rh - carve_d * _smoothstep01_np(1.0 - d_band * inv_carve_r)
+            # t is 0 inside pin_r (pinned to the route) and ramps to 1 at
+            # blend_r, where the base height takes over completely.
+            t = _smoothstep01_np((d_band - pin_r) * inv_blend_span)
+            h[in_blend] = _lerp_np(rh, h[in_blend], t)
+
+        if amp > 0.0 and blend_r > 0.0:
+            s = _smoothstep01_np((nearest_d - blend_r) * inv_blend_r)
+            h = h + _undulation_noise_grid(X, Y, undulation_frequency, noise_seed) * amp * s
+
+        prev_heights = h
         prev_size = size
-        if distances is not None:
-            final_distances = distances
-
-    return prev_heights, prev_size, final_distances
-
-
-def _smooth_heights(
-    heights: list[float],
-    size: int,
-    pinned: list[bool],
-    strength: float,
-    iterations: int,
-) -> list[float]:
-    s = float(strength)
-    if s <= 0.0 or iterations <= 0:
-        return heights
 
-    out = heights[:]
-    for _ in range(int(iterations)):
-        tmp = out[:]
-        for iy in range(1, size - 1):
-            row = iy * size
-            for ix in range(1, size - 1):
-                idx = row + ix
-                if pinned[idx]:
-                    continue
-                avg = (
-                    out[idx]
-                    + out[idx - 1]
-                    + out[idx + 1]
-                    + out[idx - size]
-                    + out[idx + size]
-                ) / 5.0
-                tmp[idx] = lerp(out[idx], avg, s)
-        out = tmp
-    return out
+    heights32 = prev_heights.ravel().astype(np.float32)
+    distances32 = nearest_d_f.ravel().astype(np.float32)
+    return heights32, prev_size, distances32
 
 
-def _limit_slope(
-    heights: list[float],
+def _relax_heights(
+    heights: np.ndarray,
     size: int,
-    pinned: list[bool],
+    pinned: np.ndarray,
+    smooth_strength: float,
+    smooth_iterations: int,
     max_slope_m_per_m: float,
     dx: float,
     dy: float,
-    iterations: int,
-) -> list[float]:
-    it = max(0, int(iterations))
-    if it == 0:
-        return heights
-
+    slope_iterations: int,
+) -> np.ndarray:
+    """Fused smoothing + slope-limit relaxation over the height grid.
+
+    Each Jacobi iteration applies the 5-point smoothing step (while smoothing
+    passes remain) and then clamps free cells to the slope envelope of their
+    neighbors, so the grid is swept once per iteration instead of once per
+    stencil. Pinned cells never move; trailing iterations beyond the smoothing
+    count are slope-only.
+    """
+    smooth_s = max(0.0, float(smooth_strength))
+    smooth_it = max(0, int(smooth_iterations)) if smooth_s > 0.0 else 0
     max_slope = max(0.0, float(max_slope_m_per_m))
-    if max_slope <= 0.0:
+    slope_it = max(0, int(slope_iterations)) if max_slope > 0.0 else 0
+    total_it = max(smooth_it, slope_it)
+    if total_it == 0:
         return heights
 
     max_dhx = max_slope * max(1e-6, float(dx))
     max_dhy = max_slope * max(1e-6, float(dy))
 
-    out = heights[:]
-    for _ in range(it):
-        for iy in range(size):
-            row = iy * size
-            for ix in range(size):
-                idx = row + ix
-                if pinned[idx]:
-                    continue
-                h = out[idx]
-
-                lo = -1e30
-                hi = 1e30
-                if ix > 0:
-                    hn = out[idx - 1]
-                    lo = max(lo, hn - max_dhx)
-                    hi = min(hi, hn + max_dhx)
-                if ix < size - 1:
-                    hn = out[idx + 1]
-                    lo = max(lo, hn - max_dhx)
-                    hi = min(hi, hn + max_dhx)
-                if iy > 0:
-                    hn = out[idx - size]
-                    lo = max(lo, hn - max_dhy)
-                    hi = min(hi, hn + max_dhy)
-                if iy < size - 1:
-                    hn = out[idx + size]
-                    lo = max(lo, hn - max_dhy)
-                    hi = min(hi, hn + max_dhy)
-
-                if h < lo:
-                    out[idx] = lo
-                elif h > hi:
-                    out[idx] = hi
-    return out
+    h = heights.astype(np.float32, copy=True).reshape(size, size)
+    pin2d = pinned.reshape(size, size)
+    free_inner = ~pin2d[1:-1, 1:-1]
+    lo = np.empty_like(h)
+    hi = np.empty_like(h)
+    tmp = np.empty_like(h)
+    avg = np.empty_like(h[1:-1, 1:-1])
+    for it in range(total_it):
+        if it < smooth_it:
+            # Jacobi step: the 5-point average is fully evaluated from the
+            # previous iteration before the interior is written back. All
+            # arithmetic runs in-place on the preallocated avg buffer.
+            inner = h[1:-1, 1:-1]
+            np.add(inner, h[1:-1, :-2], out=avg)
+            avg += h[1:-1, 2:]
+            avg += h[:-2, 1:-1]
+            avg += h[2:, 1:-1]
+            avg *= 0.2
+            avg -= inner
+            avg *= smooth_s
+            avg += inner
+            np.copyto(inner, avg, where=free_inner)
+
+        if it < slope_it:
+            # Allowed band per cell from the current neighbors (edge cells
+            # simply have fewer constraints).
+            lo.fill(-1e30)
+            hi.fill(1e30)
+            np.maximum(lo[:, 1:], h[:, :-1] - max_dhx, out=lo[:, 1:])
+            np.minimum(hi[:, 1:], h[:, :-1] + max_dhx, out=hi[:, 1:])
+            np.maximum(lo[:, :-1], h[:, 1:] - max_dhx, out=lo[:, :-1])
+            np.minimum(hi[:, :-1], h[:, 1:] + max_dhx, out=hi[:, :-1])
+            np.maximum(lo[1:, :], h[:-1, :] - max_dhy, out=lo[1:, :])
+            np.minimum(hi[1:, :], h[:-1, :] + max_dhy, out=hi[1:, :])
+            np.maximum(lo[:-1, :], h[1:, :] - max_dhy, out=lo[:-1, :])
+            np.minimum(hi[:-1, :], h[1:, :] + max_dhy, out=hi[:-1, :])
+            # Clamp into the spare buffer, restore pinned cells, then
+            # ping-pong instead of allocating fresh arrays per pass.
+            np.clip(h, lo, hi, out=tmp)
+            tmp[pin2d] = h[pin2d]
+            h, tmp = tmp, h
+    return h.ravel()
 
 
 def create_terrain(
@@ -569,13 +724,9 @@ def create_terrain(
     detail = max(1, min(5, int(terrain_detail)))
     style = max(0.0, min(1.0, float(terrain_style)))
 
-    resolution_by_detail = {1: 64, 2: 96, 3: 128, 4: 192, 5: 256}
-    iterations_by_detail = {1: 2, 2: 3, 3: 3, 4: 4, 5: 5}
-    divisor_by_detail = {1: 32, 2: 32, 3: 32, 4: 16, 5: 16}
-
-    grid_resolution = resolution_by_detail[detail]
-    multiscale_iterations = iterations_by_detail[detail]
-    initial_scale_divisor = divisor_by_detail[detail]
+    grid_resolution = _RESOLUTION_BY_DETAIL[detail]
+    multiscale_iterations = _MULTISCALE_ITERS_BY_DETAIL[detail]
+    initial_scale_divisor = _SCALE_DIVISOR_BY_DETAIL[detail]
 
     half_road_w = max(0.0, float(road_width_m) * 0.5)
     pin_radius_m = max(0.0, half_road_w + max(0.25, float(road_width_m) * 0.05))
@@ -601,62 +752,66 @@ def create_terrain(
         carve_radius_m=carve_radius_m,
     )
 
-    bm = bmesh.new()
-    uv_layer = bm.loops.layers.uv.new("UVMap")
-    verts: list[list[bmesh.types.BMVert]] = []
     width = bounds.size_x
     depth = bounds.size_y
 
-    pinned = [False] * (size * size)
-    for i, d in enumerate(distances):
-        pinned[i] = d <= pin_radius_m
+    pinned = distances <= pin_radius_m
 
     dx = width / float(max(1, size - 1))
     dy = depth / float(max(1, size - 1))
     slope_max = lerp(0.25, 0.85, style)
-    slope_iterations = {1: 20, 2: 30, 3: 40, 4: 50, 5: 60}[detail]
-    heights = _limit_slope(heights, size, pinned, slope_max, dx, dy, slope_iterations)
-
+    slope_iterations = _SLOPE_ITERS_BY_DETAIL[detail]
     smooth_strength = lerp(0.55, 0.10, style)
-    smooth_iters = {1: 6, 2: 5, 3: 4, 4: 3, 5: 2}[detail]
-    heights = _smooth_heights(heights, size, pinned, smooth_strength, smooth_iters)
-
-    for iy in range(size):
-        row: list[bmesh.types.BMVert] = []
-        fy = iy / float(size - 1)
-        y = bounds.min_y + fy * depth
-        for ix in range(size):
-            fx = ix / float(size - 1)
-            x = bounds.min_x + fx * width
-            z = float(heights[ix + iy * size])
-            row.append(bm.verts.new((x, y, z)))
-        verts.append(row)
-
-    bm.verts.ensure_lookup_table()
-
-    for iy in range(size - 1):
-        for ix in range(size - 1):
-            v00 = verts[iy][ix]
-            v10 = verts[iy][ix + 1]
-            v11 = verts[iy + 1][ix + 1]
-            v01 = verts[iy + 1][ix]
-            try:
-                f = bm.faces.new((v00, v10, v11, v01))
-                tile = max(0.001, float(TERRAIN_UV_TILE_M))
-                for loop in f.loops:
-                    co = loop.vert.co
-                    loop[uv_layer].uv = (
-                        (co.x - bounds.min_x) / tile,
-                        (co.y - bounds.min_y) / tile,
-                    )
-            except ValueError:
-                pass
-
-    bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
+    smooth_iters = _SMOOTH_ITERS_BY_DETAIL[detail]
+    heights = _relax_heights(
+        heights,
+        size,
+        pinned,
+        smooth_strength,
+        smooth_iters,
+        slope_max,
+        dx,
+        dy,
+        slope_iterations,
+    )
 
+    xs = np.linspace(bounds.min_x, bounds.max_x, size)
+    ys = np.linspace(bounds.min_y, bounds.max_y, size)
+    X, Y = np.meshgrid(xs, ys)
+
+    coords = np.empty((size * size, 3), dtype=np.float32)
+    coords[:, 0] = X.ravel()
+    coords[:, 1] = Y.ravel()
+    coords[:, 2] = heights
+
+    # Quad index grid with the same (v00, v10, v11, v01) winding as before,
+    # so face normals come out facing +Z without a recalc pass.
+    r_idx, c_idx = np.mgrid[0 : size - 1, 0 : size - 1]
+    v00 = (r_idx * size + c_idx).ravel()
+    quads = np.stack([v00, v00 + 1, v00 + size + 1, v00 + size], axis=-1)
+    loop_verts = quads.ravel().astype(np.int32)
+    num_faces = quads.shape[0]
+
+    # Bulk upload: one memcpy per attribute instead of a Python call per
+    # vertex/face through bmesh.
     mesh = bpy.data.meshes.new(name)
-    bm.to_mesh(mesh)
-    bm.free()
+    mesh.vertices.add(size * size)
+    mesh.vertices.foreach_set("co", coords.ravel())
+    mesh.loops.add(num_faces * 4)
+    mesh.loops.foreach_set("vertex_index", loop_verts)
+    mesh.polygons.add(num_faces)
+    mesh.polygons.foreach_set("loop_start", np.arange(0, num_faces * 4, 4, dtype=np.int32))
+    mesh.polygons.foreach_set("loop_total", np.full(num_faces, 4, dtype=np.int32))
+
+    tile = max(0.001, float(TERRAIN_UV_TILE_M))
+    uv = np.empty((size * size, 2), dtype=np.float32)
+    uv[:, 0] = (coords[:, 0] - bounds.min_x) / tile
+    uv[:, 1] = (coords[:, 1] - bounds.min_y) / tile
+    uv_layer = mesh.uv_layers.new(name="UVMap")
+    uv_layer.data.foreach_set("uv", uv[loop_verts].ravel())
+
+    mesh.update(calc_edges=True)
+    mesh.validate()
     return bpy.data.objects.new(name, mesh)
 
 
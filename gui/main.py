@@ -3,17 +3,73 @@ from ..material.manager import apply_textures_from_scene_settings
 from .translations import t
 
 
-def update_textures(self, context):
-    """Update textures on existing objects when properties change."""
-    terrain_obj = getattr(self, "texture_terrain_obj", None) or bpy.data.objects.get("RWB_Terrain")
-    road_obj = getattr(self, "texture_road_obj", None) or bpy.data.objects.get("RWB_Road")
-
+# Slider drags fire the update callback for every intermediate value;
+# rebuilding the material graph per tick makes dragging stutter. A short
+# timer coalesces a burst into one apply of the final state.
+_texture_update_pending = False
+_last_texture_signature = None
+
+
+def _texture_signature(p, terrain_obj, road_obj):
+    return (
+        terrain_obj.as_pointer() if terrain_obj else 0,
+        road_obj.as_pointer() if road_obj else 0,
+        str(p.texture_root_dir),
+        bool(p.apply_terrain_textures),
+        bool(p.apply_road_textures),
+        str(p.terrain_ground_texture_dir),
+        str(p.terrain_rock_texture_dir),
+        str(p.terrain_snow_texture_dir),
+        float(p.terrain_texture_scale),
+        int(p.texture_variants),
+    )
+
+
+def _flush_texture_update():
+    global _texture_update_pending, _last_texture_signature
+    _texture_update_pending = False
+    scene = getattr(bpy.context, "scene", None)
+    p = getattr(scene, "route2world", None) if scene else None
+    if p is None:
+        return None
+
+    # The pointer properties are the source of truth (the generator fills
+    # them in); the name scan only runs for scenes that predate them.
+    terrain_obj = p.texture_terrain_obj or bpy.data.objects.get("RWB_Terrain")
+    road_obj = p.texture_road_obj or bpy.data.objects.get("RWB_Road")
     if terrain_obj or road_obj:
+        # A burst that ends on the starting value (drag out and back, or
+        # a no-op toggle) would rebuild the same material graph; skip it.
+        signature = _texture_signature(p, terrain_obj, road_obj)
+        if signature == _last_texture_signature:
+            return None
         apply_textures_from_scene_settings(
-            self,
+            p,
             terrain_obj=terrain_obj,
             road_obj=road_obj
         )
+        _last_texture_signature = signature
+    return None
+
+
+def update_textures(self, context):
+    """Schedule a texture re-apply when properties change (debounced)."""
+    global _texture_update_pending
+    if _texture_update_pending:
+        return
+    _texture_update_pending = True
+    bpy.app.timers.register(_flush_texture_update, first_interval=0.1)
+
+
+def invalidate_texture_signature():
+    """Forget the last-applied texture state.
+
+    Reset Textures deletes the materials the signature describes; without
+    this, a later burst ending on the same property values would compare
+    equal and skip the re-apply, leaving the objects untextured.
+    """
+    global _last_texture_signature
+    _last_texture_signature = None
 
 
 def _poll_mesh_object(self, obj):
@@ -261,18 +317,48 @@ class Route2WorldProperties(bpy.types.PropertyGroup):
     )
 
 
-class ROUTE2WORLD_PT_Main(bpy.types.Panel):
+class _TranslatedLabelsMixin:
+    # t() walks locale detection on every call; panel draws run per
+    # redraw, so each panel resolves its static labels once and reuses
+    # the dict. refresh_panel_labels() drops the caches if the locale
+    # ever changes mid-session.
+    _label_keys: tuple[str, ...] = ()
+    _label_cache: dict[str, str] | None = None
+
+    @classmethod
+    def _labels(cls) -> dict[str, str]:
+        cache = cls._label_cache
+        if cache is None:
+            cache = cls._label_cache = {k: t(k) for k in cls._label_keys}
+        return cache
+
+
+def refresh_panel_labels() -> None:
+    # Subclass walk instead of a hand-kept list so panels defined in
+    # other modules (gui.scatter) are covered without importing them
+    # here, which would be circular. Recursive because _labels() caches
+    # on the concrete class, which may sit below an intermediate base.
+    stack = list(_TranslatedLabelsMixin.__subclasses__())
+    while stack:
+        cls = stack.pop()
+        cls._label_cache = None
+        stack.extend(cls.__subclasses__())
+
+
+class ROUTE2WORLD_PT_Main(_TranslatedLabelsMixin, bpy.types.Panel):
     bl_label = "Route2World"
     bl_space_type = "VIEW_3D"
     bl_region_type = "UI"
     bl_category = "Route2World"
     bl_options = {"DEFAULT_CLOSED"}
 
+    _label_keys = ("Workflow",)
+
     def draw(self, context):
-        self.layout.label(text=t("Workflow"))
+        self.layout.label(text=self._labels()["Workflow"])
 
 
-class ROUTE2WORLD_PT_Step1Generate(bpy.types.Panel):
+class ROUTE2WORLD_PT_Step1Generate(_TranslatedLabelsMixin, bpy.types.Panel):
     bl_label = t("Step 1: Generate Route/Road/Terrain")
     bl_space_type = "VIEW_3D"
     bl_region_type = "UI"
@@ -280,49 +366,114 @@ class ROUTE2WORLD_PT_Step1Generate(bpy.types.Panel):
     bl_parent_id = "ROUTE2WORLD_PT_Main"
     bl_options = {"DEFAULT_CLOSED"}
 
+    _label_keys = (
+        "GPX",
+        "Smoothing Window",
+        "Smoothing Iterations",
+        "Mode",
+        "Create Route Curve",
+        "Create Road Mesh",
+        "Create Terrain",
+        "Generate Route/Road/Terrain",
+        "Download Terrain",
+    )
+
     def draw(self, context):
         p = context.scene.route2world
+        # draw() runs on every redraw; read the branch-deciding properties
+        # once instead of going through RNA dispatch per use.
+        process_mode = p.process_mode
+        L = self._labels()
         box = self.layout.box()
 
-        box.prop(p, "gpx_filepath", text=t("GPX"))
+        box.prop(p, "gpx_filepath", text=L["GPX"])
 
         row = box.row(align=True)
-        row.prop(p, "gpx_smoothing_window", text=t("Smoothing Window"))
-        row.prop(p, "gpx_smoothing_iterations", text=t("Smoothing Iterations"))
+        row.prop(p, "gpx_smoothing_window", text=L["Smoothing Window"])
+        row.prop(p, "gpx_smoothing_iterations", text=L["Smoothing Iterations"])
 
         row = box.row()
-        row.prop(p, "process_mode", expand=True, text=t("Mode"))
+        row.prop(p, "process_mode", expand=True, text=L["Mode"])
 
         row = box.row(align=True)
-        row.prop(p, "create_route_curve", toggle=True, text=t("Create Route Curve"))
-        row.prop(p, "create_road_mesh", toggle=True, text=t("Create Road Mesh"))
-        row.prop(p, "create_terrain", toggle=True, text=t("Create Terrain"))
-
-        if p.create_terrain:
-            box.separator()
-            box.label(text=t("Terrain Settings"), icon="MESH_DATA")
-            box.prop(p, "terrain_margin_m", text=t("Terrain Margin (m)"))
-            box.prop(p, "terrain_detail", text=t("Detail"))
-            if p.process_mode == "AUTO":
-                box.prop(p, "terrain_style", text=t("Style"))
-                box.prop(p, "seed", text=t("Seed"))
-
-        if p.create_road_mesh:
-            box.separator()
-            box.label(text=t("Road Settings"), icon="DRIVER")
-            box.prop(p, "road_width_m", text=t("Road Width (m)"))
-            box.prop(p, "road_offset_m", text=t("Road Offset (m)"))
-            box.prop(p, "road_embed_m", text=t("Road Embed (m)"))
-            box.prop(p, "road_thickness_m", text=t("Road Thickness (m)"))
+        row.prop(p, "create_route_curve", toggle=True, text=L["Create Route Curve"])
+        row.prop(p, "create_road_mesh", toggle=True, text=L["Create Road Mesh"])
+        row.prop(p, "create_terrain", toggle=True, text=L["Create Terrain"])
 
         box.separator()
-        btn_text = t("Generate Route/Road/Terrain")
-        if p.process_mode == "MAPBOX":
-            btn_text = t("Download Terrain")
+        btn_text = L["Generate Route/Road/Terrain"]
+        if process_mode == "MAPBOX":
+            btn_text = L["Download Terrain"]
         box.operator("route2world.generate_from_gpx", text=btn_text)
 
 
-class ROUTE2WORLD_PT_Step2Textures(bpy.types.Panel):
+class ROUTE2WORLD_PT_Step1Terrain(_TranslatedLabelsMixin, bpy.types.Panel):
+    # Child panel with a poll so Blender skips draw() entirely while the
+    # Create Terrain toggle is off, instead of branching every redraw.
+    bl_label = t("Terrain Settings")
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "Route2World"
+    bl_parent_id = "ROUTE2WORLD_PT_Step1Generate"
+    bl_options = {"DEFAULT_CLOSED"}
+
+    _label_keys = (
+        "Terrain Margin (m)",
+        "Detail",
+        "Style",
+        "Seed",
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return context.scene.route2world.create_terrain
+
+    def draw(self, context):
+        p = context.scene.route2world
+        L = self._labels()
+        box = self.layout.box()
+        box.prop(p, "terrain_margin_m", text=L["Terrain Margin (m)"])
+        box.prop(p, "terrain_detail", text=L["Detail"])
+        if p.process_mode == "AUTO":
+            box.prop(p, "terrain_style", text=L["Style"])
+            box.prop(p, "seed", text=L["Seed"])
+
+
+class ROUTE2WORLD_PT_Step1Road(_TranslatedLabelsMixin, bpy.types.Panel):
+    bl_label = t("Road Settings")
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "Route2World"
+    bl_parent_id = "ROUTE2WORLD_PT_Step1Generate"
+    bl_options = {"DEFAULT_CLOSED"}
+
+    _label_keys = (
+        "Road Width (m)",
+        "Road Offset (m)",
+        "Road Embed (m)",
+        "Road Thickness (m)",
+    )
+
+    _ROAD_FIELDS = (
+        ("road_width_m", "Road Width (m)"),
+        ("road_offset_m", "Road Offset (m)"),
+        ("road_embed_m", "Road Embed (m)"),
+        ("road_thickness_m", "Road Thickness (m)"),
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return context.scene.route2world.create_road_mesh
+
+    def draw(self, context):
+        p = context.scene.route2world
+        L = self._labels()
+        box = self.layout.box()
+        for attr, label in self._ROAD_FIELDS:
+            box.prop(p, attr, text=L[label])
+
+
+class ROUTE2WORLD_PT_Step2Textures(_TranslatedLabelsMixin, bpy.types.Panel):
     bl_label = t("Step 2: Road & Terrain Textures")
     bl_space_type = "VIEW_3D"
     bl_region_type = "UI"
@@ -330,46 +481,84 @@ class ROUTE2WORLD_PT_Step2Textures(bpy.types.Panel):
     bl_parent_id = "ROUTE2WORLD_PT_Main"
     bl_options = {"DEFAULT_CLOSED"}
 
+    _label_keys = (
+        "Targets",
+        "Terrain",
+        "Road",
+        "Textures",
+        "Texture Root",
+        "Texture Terrain",
+        "Texture Road",
+        "Ground Texture",
+        "Rock Texture",
+        "Snow Texture",
+        "Texture Scale",
+        "Material Blending",
+        "Ground Ratio",
+        "Rock Ratio",
+        "Height Blend",
+        "Texture Variants",
+        "Mix Scale",
+        "Apply Textures",
+        "Reset Textures",
+    )
+
+    _TERRAIN_FIELDS = (
+        ("terrain_ground_texture_dir", "Ground Texture"),
+        ("terrain_rock_texture_dir", "Rock Texture"),
+        ("terrain_snow_texture_dir", "Snow Texture"),
+        ("terrain_texture_scale", "Texture Scale"),
+    )
+    _BLEND_FIELDS = (
+        ("terrain_ground_ratio", "Ground Ratio"),
+        ("terrain_rock_ratio", "Rock Ratio"),
+        ("terrain_height_blend", "Height Blend"),
+    )
+    _ROAD_FIELDS = (
+        ("texture_variants", "Texture Variants"),
+        ("texture_noise_scale", "Mix Scale"),
+    )
+
     def draw(self, context):
         p = context.scene.route2world
+        apply_terrain = p.apply_terrain_textures
+        apply_road = p.apply_road_textures
+        L = self._labels()
         box = self.layout.box()
 
-        box.label(text=t("Targets"))
-        box.prop(p, "texture_terrain_obj", text=t("Terrain"))
-        box.prop(p, "texture_road_obj", text=t("Road"))
+        box.label(text=L["Targets"])
+        box.prop(p, "texture_terrain_obj", text=L["Terrain"])
+        box.prop(p, "texture_road_obj", text=L["Road"])
         box.separator()
 
-        box.label(text=t("Textures"), icon="TEXTURE")
-        box.prop(p, "texture_root_dir", text=t("Texture Root"))
+        box.label(text=L["Textures"], icon="TEXTURE")
+        box.prop(p, "texture_root_dir", text=L["Texture Root"])
         row = box.row(align=True)
-        row.prop(p, "apply_terrain_textures", toggle=True, text=t("Texture Terrain"))
-        row.prop(p, "apply_road_textures", toggle=True, text=t("Texture Road"))
+        row.prop(p, "apply_terrain_textures", toggle=True, text=L["Texture Terrain"])
+        row.prop(p, "apply_road_textures", toggle=True, text=L["Texture Road"])
 
-        if p.apply_terrain_textures:
+        if apply_terrain:
             box.separator()
-            box.label(text=t("Terrain"), icon="MESH_GRID")
-            box.prop(p, "terrain_ground_texture_dir", text=t("Ground Texture"))
-            box.prop(p, "terrain_rock_texture_dir", text=t("Rock Texture"))
-            box.prop(p, "terrain_snow_texture_dir", text=t("Snow Texture"))
-            box.prop(p, "terrain_texture_scale", text=t("Texture Scale"))
+            box.label(text=L["Terrain"], icon="MESH_GRID")
+            for attr, label in self._TERRAIN_FIELDS:
+                box.prop(p, attr, text=L[label])
             box.separator()
-            box.label(text=t("Material Blending"))
-            box.prop(p, "terrain_ground_ratio", text=t("Ground Ratio"))
-            box.prop(p, "terrain_rock_ratio", text=t("Rock Ratio"))
-            box.prop(p, "terrain_height_blend", text=t("Height Blend"))
+            box.label(text=L["Material Blending"])
+            for attr, label in self._BLEND_FIELDS:
+                box.prop(p, attr, text=L[label])
 
-        if p.apply_road_textures:
+        if apply_road:
             box.separator()
-            box.label(text=t("Road"), icon="CURVE_DATA")
-            box.prop(p, "texture_variants", text=t("Texture Variants"))
-            box.prop(p, "texture_noise_scale", text=t("Mix Scale"))
+            box.label(text=L["Road"], icon="CURVE_DATA")
+            for attr, label in self._ROAD_FIELDS:
+                box.prop(p, attr, text=L[label])
 
         box.separator()
-        box.operator("route2world.apply_textures", text=t("Apply Textures"))
-        box.operator("route2world.reset_textures", text=t("Reset Textures"))
+        box.operator("route2world.apply_textures", text=L["Apply Textures"])
+        box.operator("route2world.reset_textures", text=L["Reset Textures"])
 
 
-class ROUTE2WORLD_PT_Step3PostProcess(bpy.types.Panel):
+class ROUTE2WORLD_PT_Step3PostProcess(_TranslatedLabelsMixin, bpy.types.Panel):
     bl_label = t("Step 3: Terrain Post Process")
     bl_space_type = "VIEW_3D"
     bl_region_type = "UI"
@@ -377,14 +566,31 @@ class ROUTE2WORLD_PT_Step3PostProcess(bpy.types.Panel):
     bl_parent_id = "ROUTE2WORLD_PT_Main"
     bl_options = {"DEFAULT_CLOSED"}
 
+    _label_keys = (
+        "Post Process",
+        "Terrain",
+        "Road",
+        "Transition Width (m)",
+        "Flat Width (m)",
+        "Clearance (m)",
+        "Subdivide Levels",
+        "Apply Terrain Transition",
+    )
+
+    _FIELDS = (
+        ("terrain_transition_terrain_obj", "Terrain"),
+        ("terrain_transition_road_obj", "Road"),
+        ("terrain_transition_width_m", "Transition Width (m)"),
+        ("terrain_transition_flat_width_m", "Flat Width (m)"),
+        ("terrain_transition_clearance_m", "Clearance (m)"),
+        ("terrain_transition_subdivide_levels", "Subdivide Levels"),
+    )
+
     def draw(self, context):
         p = context.scene.route2world
+        L = self._labels()
         box = self.layout.box()
-        box.label(text=t("Post Process"))
-        box.prop(p, "terrain_transition_terrain_obj", text=t("Terrain"))
-        box.prop(p, "terrain_transition_road_obj", text=t("Road"))
-        box.prop(p, "terrain_transition_width_m", text=t("Transition Width (m)"))
-        box.prop(p, "terrain_transition_flat_width_m", text=t("Flat Width (m)"))
-        box.prop(p, "terrain_transition_clearance_m", text=t("Clearance (m)"))
-        box.prop(p, "terrain_transition_subdivide_levels", text=t("Subdivide Levels"))
-        box.operator("route2world.apply_terrain_transition", text=t("Apply Terrain Transition"))
+        box.label(text=L["Post Process"])
+        for attr, label in self._FIELDS:
+            box.prop(p, attr, text=L[label])
+        box.operator("route2world.apply_terrain_transition", text=L["Apply Terrain Transition"])
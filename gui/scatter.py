@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import bpy
+from .main import _TranslatedLabelsMixin
 from .translations import t
 
 
@@ -87,7 +88,16 @@ class Route2WorldScatterProperties(bpy.types.PropertyGroup):
     grass_scale_max: bpy.props.FloatProperty(name="Grass Scale Max", min=0.01, soft_max=10.0, default=1.1)
 
 
-class ROUTE2WORLD_PT_Procedural(bpy.types.Panel):
+# Labeled min/max pairs rendered through one grid_flow per asset type,
+# instead of a separator + label + row allocation per group.
+_MINMAX_GROUPS = (
+    ("Offset", "_offset_min_m", "_offset_max_m"),
+    ("Scale", "_scale_min", "_scale_max"),
+)
+_MINMAX_GROUPS_CLUSTER = _MINMAX_GROUPS + (("Cluster", "_cluster_min", "_cluster_max"),)
+
+
+class ROUTE2WORLD_PT_Procedural(_TranslatedLabelsMixin, bpy.types.Panel):
     bl_label = t("Step 4: Place Assets")
     bl_space_type = "VIEW_3D"
     bl_region_type = "UI"
@@ -95,98 +105,141 @@ class ROUTE2WORLD_PT_Procedural(bpy.types.Panel):
     bl_parent_id = "ROUTE2WORLD_PT_Main"
     bl_options = {"DEFAULT_CLOSED"}
 
+    _label_keys = (
+        "Targets",
+        "Route",
+        "Terrain",
+        "Assets Root",
+        "Scatter Control",
+        "Side",
+        "Seed",
+        "Max Instances",
+        "Road No-Spawn (m)",
+        "Scatter Assets",
+    )
+
     def draw(self, context):
         s = context.scene.route2world_scatter
+        L = self._labels()
         box = self.layout.box()
 
-        box.label(text=t("Targets"))
-        box.prop(s, "route_object", text=t("Route"))
-        box.prop(s, "terrain_object", text=t("Terrain"))
-        box.prop(s, "assets_root_dir", text=t("Assets Root"))
+        box.label(text=L["Targets"])
+        box.prop(s, "route_object", text=L["Route"])
+        box.prop(s, "terrain_object", text=L["Terrain"])
+        box.prop(s, "assets_root_dir", text=L["Assets Root"])
 
         box.separator()
-        box.label(text=t("Scatter Control"))
+        box.label(text=L["Scatter Control"])
 
         row = box.row()
-        row.prop(s, "scatter_side", expand=True, text=t("Side"))
+        row.prop(s, "scatter_side", expand=True, text=L["Side"])
 
         col = box.column()
-        col.prop(s, "scatter_seed", text=t("Seed"))
-        col.prop(s, "max_instances", text=t("Max Instances"))
-        col.prop(s, "road_no_spawn_m", text=t("Road No-Spawn (m)"))
+        col.prop(s, "scatter_seed", text=L["Seed"])
+        col.prop(s, "max_instances", text=L["Max Instances"])
+        col.prop(s, "road_no_spawn_m", text=L["Road No-Spawn (m)"])
 
         box.separator()
-        box.operator("route2world.scatter_roadside_assets", text=t("Scatter Assets"))
+        box.operator("route2world.scatter_roadside_assets", text=L["Scatter Assets"])
 
-        box.separator()
-        box.label(text=t("Asset Types"))
 
-        row = box.row()
-        row.prop(s, "building_enabled", text=t("Buildings"), icon="MESH_DATA", toggle=True)
-        if s.building_enabled:
-            col = box.column(align=True)
-            col.prop(s, "building_spacing_m", text=t("Building Spacing (m)"))
-            col.prop(s, "building_probability", text=t("Building Probability"))
-            col.prop(s, "building_min_distance_m", text=t("Building Min Distance (m)"))
-
-            col.separator()
-            col.label(text=t("Offset"))
-            row = col.row(align=True)
-            row.prop(s, "building_offset_min_m", text=t("Min"))
-            row.prop(s, "building_offset_max_m", text=t("Max"))
-
-            col.separator()
-            col.label(text=t("Scale"))
-            row = col.row(align=True)
-            row.prop(s, "building_scale_min", text=t("Min"))
-            row.prop(s, "building_scale_max", text=t("Max"))
-
-            col.separator()
-            col.label(text=t("Cluster"))
-            row = col.row(align=True)
-            row.prop(s, "building_cluster_min", text=t("Min"))
-            row.prop(s, "building_cluster_max", text=t("Max"))
-            col.prop(s, "building_cluster_along_m", text=t("Building Cluster Along (m)"))
-            col.prop(s, "building_cluster_out_m", text=t("Building Cluster Out (m)"))
+class _ScatterAssetPanel(_TranslatedLabelsMixin):
+    # Shared body for the per-asset-type sub-panels. Each is a real
+    # child panel, so Blender skips draw() entirely while it is
+    # collapsed; the enable toggle lives in the header.
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "Route2World"
+    bl_parent_id = "ROUTE2WORLD_PT_Procedural"
+    bl_options = {"DEFAULT_CLOSED"}
 
-        box.separator()
-        row = box.row()
-        row.prop(s, "tree_enabled", text=t("Trees"), icon="OUTLINER_OB_CURVE", toggle=True)
-        if s.tree_enabled:
-            col = box.column(align=True)
-            col.prop(s, "tree_spacing_m", text=t("Tree Spacing (m)"))
-            col.prop(s, "tree_probability", text=t("Tree Probability"))
-            col.prop(s, "tree_min_distance_m", text=t("Tree Min Distance (m)"))
-
-            col.separator()
-            col.label(text=t("Offset"))
-            row = col.row(align=True)
-            row.prop(s, "tree_offset_min_m", text=t("Min"))
-            row.prop(s, "tree_offset_max_m", text=t("Max"))
-
-            col.separator()
-            col.label(text=t("Scale"))
-            row = col.row(align=True)
-            row.prop(s, "tree_scale_min", text=t("Min"))
-            row.prop(s, "tree_scale_max", text=t("Max"))
+    _prefix = ""
+    _singular = ""
+    _has_cluster = False
 
-        box.separator()
-        row = box.row()
-        row.prop(s, "grass_enabled", text=t("Grass"), toggle=True)
-        col = box.column(align=True)
-        col.enabled = bool(s.grass_enabled)
-        col.prop(s, "grass_spacing_m", text=t("Grass Spacing (m)"))
-        col.prop(s, "grass_probability", text=t("Grass Probability"))
-        col.prop(s, "grass_min_distance_m", text=t("Grass Min Distance (m)"))
+    def draw_header(self, context):
+        s = context.scene.route2world_scatter
+        self.layout.prop(s, self._prefix + "_enabled", text="")
 
-        col.separator()
-        col.label(text=t("Offset"))
-        row = col.row(align=True)
-        row.prop(s, "grass_offset_min_m", text=t("Min"))
-        row.prop(s, "grass_offset_max_m", text=t("Max"))
+    def draw(self, context):
+        s = context.scene.route2world_scatter
+        L = self._labels()
+        prefix = self._prefix
+        singular = self._singular
+        has_cluster = self._has_cluster
+
+        layout = self.layout
+        layout.enabled = getattr(s, prefix + "_enabled")
+
+        col = layout.column(align=True)
+        col.prop(s, prefix + "_spacing_m", text=L[singular + " Spacing (m)"])
+        col.prop(s, prefix + "_probability", text=L[singular + " Probability"])
+        col.prop(s, prefix + "_min_distance_m", text=L[singular + " Min Distance (m)"])
 
         col.separator()
-        col.label(text=t("Scale"))
-        row = col.row(align=True)
-        row.prop(s, "grass_scale_min", text=t("Min"))
-        row.prop(s, "grass_scale_max", text=t("Max"))
+        grid = col.grid_flow(row_major=True, columns=2, align=True)
+        groups = _MINMAX_GROUPS_CLUSTER if has_cluster else _MINMAX_GROUPS
+        for group_label, lo, hi in groups:
+            grid.label(text=L[group_label])
+            grid.label(text="")
+            grid.prop(s, prefix + lo, text=L["Min"])
+            grid.prop(s, prefix + hi, text=L["Max"])
+
+        if has_cluster:
+            col.prop(s, prefix + "_cluster_along_m", text=L[singular + " Cluster Along (m)"])
+            col.prop(s, prefix + "_cluster_out_m", text=L[singular + " Cluster Out (m)"])
+
+
+class ROUTE2WORLD_PT_ScatterBuildings(_ScatterAssetPanel, bpy.types.Panel):
+    bl_label = t("Buildings")
+
+    _prefix = "building"
+    _singular = "Building"
+    _has_cluster = True
+
+    _label_keys = (
+        "Building Spacing (m)",
+        "Building Probability",
+        "Building Min Distance (m)",
+        "Building Cluster Along (m)",
+        "Building Cluster Out (m)",
+        "Offset",
+        "Scale",
+        "Cluster",
+        "Min",
+        "Max",
+    )
+
+
+class ROUTE2WORLD_PT_ScatterTrees(_ScatterAssetPanel, bpy.types.Panel):
+    bl_label = t("Trees")
+
+    _prefix = "tree"
+    _singular = "Tree"
+
+    _label_keys = (
+        "Tree Spacing (m)",
+        "Tree Probability",
+        "Tree Min Distance (m)",
+        "Offset",
+        "Scale",
+        "Min",
+        "Max",
+    )
+
+
+class ROUTE2WORLD_PT_ScatterGrass(_ScatterAssetPanel, bpy.types.Panel):
+    bl_label = t("Grass")
+
+    _prefix = "grass"
+    _singular = "Grass"
+
+    _label_keys = (
+        "Grass Spacing (m)",
+        "Grass Probability",
+        "Grass Min Distance (m)",
+        "Offset",
+        "Scale",
+        "Min",
+        "Max",
+    )
@@ -5,6 +5,7 @@ import random
 from dataclasses import dataclass
 
 import bpy
+import numpy as np
 
 
 _IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".tif", ".tiff", ".exr", ".hdr")
@@ -29,66 +30,118 @@ class TextureSet:
     displacement: str | None
 
 
-def _find_first_file(folder: str, patterns: list[str]) -> str | None:
+# Each texture-set folder is probed for five or six patterns (color,
+# ao, roughness, normal, displacement); index its image files once and
+# answer the pattern matches from memory. Keyed by folder path and
+# validated against the directory mtime, so adding or removing files
+# invalidates the entry without an explicit flush.
+_FOLDER_INDEX_CACHE: dict[str, tuple[int, tuple[tuple[str, str], ...]]] = {}
+_FOLDER_INDEX_CACHE_MAX = 128
+
+
+def _scan_folder_once(folder: str) -> tuple[tuple[str, str], ...]:
+    try:
+        mtime = os.stat(folder).st_mtime_ns
+    except OSError:
+        return ()
+    cached = _FOLDER_INDEX_CACHE.get(folder)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    files: list[tuple[str, str]] = []
     try:
-        for fn in os.listdir(folder):
-            low = fn.lower()
-            if not low.endswith(_IMAGE_EXTS):
-                continue
-            for p in patterns:
-                if p in low:
-                    full = os.path.join(folder, fn)
-                    if os.path.isfile(full):
-                        return full
+        # scandir answers is_file() from the directory read itself, so
+        # no per-entry stat call like listdir + os.path.isfile would
+        # issue.
+        with os.scandir(folder) as it:
+            for de in it:
+                low = de.name.lower()
+                if low.endswith(_IMAGE_EXTS) and de.is_file():
+                    files.append((low, de.path))
     except FileNotFoundError:
-        return None
+        return ()
+
+    if len(_FOLDER_INDEX_CACHE) >= _FOLDER_INDEX_CACHE_MAX:
+        _FOLDER_INDEX_CACHE.clear()
+    index = tuple(files)
+    _FOLDER_INDEX_CACHE[folder] = (mtime, index)
+    return index
+
+
+def _find_first_file(folder: str, patterns: list[str]) -> str | None:
+    for low, path in _scan_folder_once(folder):
+        for p in patterns:
+            if p in low:
+                return path
     return None
 
 
 def _find_any_image(folder: str) -> str | None:
+    index = _scan_folder_once(folder)
+    return index[0][1] if index else None
+
+
+def _texture_set_from_folder(folder: str, *, name: str) -> TextureSet:
+    # All pattern probes below hit the folder's cached index, so the
+    # directory is read once per set regardless of how many map types
+    # are looked up.
+    color = _find_first_file(folder, ["_color", "albedo", "diffuse", "basecolor"])
+    if color is None:
+        color = _find_any_image(folder)
+    ao = _find_first_file(folder, ["ambientocclusion", "_ambientocclusion", "_ao", "ao"])
+    roughness = _find_first_file(folder, ["_roughness", "roughness"])
+    normal = _find_first_file(folder, ["_normalgl", "normalgl"])
+    if normal is None:
+        candidate = _find_first_file(folder, ["_normal", "normal"])
+        if candidate is not None and "normaldx" not in os.path.basename(candidate).lower():
+            normal = candidate
+    displacement = _find_first_file(folder, ["_displacement", "displacement", "height"])
+    return TextureSet(
+        name=name,
+        color=color,
+        ao=ao,
+        roughness=roughness,
+        normal=normal,
+        displacement=displacement,
+    )
+
+
+# Category scans (Ground/, Rock/, Snow/, Road/) repeat unchanged
+# between material applies; remember each directory's entry listing,
+# keyed by its mtime. Only the listing is cached, not the TextureSets:
+# a map file dropped into an existing set subfolder changes that
+# subfolder's mtime but not the category's, so the per-set probes must
+# always go through the folder index, which validates each subfolder
+# itself. reset_textures_data() drops this along with the folder index,
+# so a texture reset always rescans from disk.
+_CATEGORY_CACHE: dict[str, tuple[int, tuple[tuple[str, str, bool, bool], ...]]] = {}
+
+
+def _category_entries(category_dir: str) -> tuple[tuple[str, str, bool, bool], ...]:
+    try:
+        mtime = os.stat(category_dir).st_mtime_ns
+    except OSError:
+        return ()
+    cached = _CATEGORY_CACHE.get(category_dir)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
     try:
-        for fn in os.listdir(folder):
-            if fn.lower().endswith(_IMAGE_EXTS):
-                full = os.path.join(folder, fn)
-                if os.path.isfile(full):
-                    return full
+        with os.scandir(category_dir) as it:
+            entries = tuple(
+                sorted((de.name, de.path, de.is_dir(), de.is_file()) for de in it)
+            )
     except FileNotFoundError:
-        return None
-    return None
+        return ()
+    _CATEGORY_CACHE[category_dir] = (mtime, entries)
+    return entries
 
 
 def _collect_texture_sets(category_dir: str) -> list[TextureSet]:
     sets: list[TextureSet] = []
-    try:
-        entries = sorted(os.listdir(category_dir))
-    except FileNotFoundError:
-        return sets
-
-    for entry in entries:
-        full = os.path.join(category_dir, entry)
-        if os.path.isdir(full):
-            color = _find_first_file(full, ["_color", "albedo", "diffuse", "basecolor"])
-            if color is None:
-                color = _find_any_image(full)
-            ao = _find_first_file(full, ["ambientocclusion", "_ambientocclusion", "_ao", "ao"])
-            roughness = _find_first_file(full, ["_roughness", "roughness"])
-            normal = _find_first_file(full, ["_normalgl", "normalgl"])
-            if normal is None:
-                candidate = _find_first_file(full, ["_normal", "normal"])
-                if candidate is not None and "normaldx" not in os.path.basename(candidate).lower():
-                    normal = candidate
-            displacement = _find_first_file(full, ["_displacement", "displacement", "height"])
-            sets.append(
-                TextureSet(
-                    name=entry,
-                    color=color,
-                    ao=ao,
-                    roughness=roughness,
-                    normal=normal,
-                    displacement=displacement,
-                )
-            )
-        elif os.path.isfile(full) and entry.lower().endswith(_IMAGE_EXTS):
+    for entry, full, is_dir, is_file in _category_entries(category_dir):
+        if is_dir:
+            sets.append(_texture_set_from_folder(full, name=entry))
+        elif is_file and entry.lower().endswith(_IMAGE_EXTS):
             sets.append(
                 TextureSet(
                     name=os.path.splitext(entry)[0],
@@ -113,27 +166,10 @@ def _scan_texture_folder(folder: str) -> TextureSet | None:
     if not os.path.isdir(folder):
         return None
 
-    color = _find_first_file(folder, ["_color", "albedo", "diffuse", "basecolor"])
-    if color is None:
-        color = _find_any_image(folder)
-    if color is None:
+    t = _texture_set_from_folder(folder, name=os.path.basename(os.path.normpath(folder)))
+    if t.color is None:
         return None
-    ao = _find_first_file(folder, ["ambientocclusion", "_ambientocclusion", "_ao", "ao"])
-    roughness = _find_first_file(folder, ["_roughness", "roughness"])
-    normal = _find_first_file(folder, ["_normalgl", "normalgl"])
-    if normal is None:
-        candidate = _find_first_file(folder, ["_normal", "normal"])
-        if candidate is not None and "normaldx" not in os.path.basename(candidate).lower():
-            normal = candidate
-    displacement = _find_first_file(folder, ["_displacement", "displacement", "height"])
-    return TextureSet(
-        name=os.path.basename(os.path.normpath(folder)),
-        color=color,
-        ao=ao,
-        roughness=roughness,
-        normal=normal,
-        displacement=displacement,
-    )
+    return t
 
 
 def _pick_category_texture_set(
@@ -200,16 +236,13 @@ def _mesh_z_bounds_local(obj: bpy.types.Object) -> tuple[float, float] | None:
         return None
     if not mesh.vertices:
         return None
-    min_z = float("inf")
-    max_z = float("-inf")
-    for v in mesh.vertices:
-        z = float(v.co.z)
-        if z < min_z:
-            min_z = z
-        if z > max_z:
-            max_z = z
-    if min_z == float("inf") or max_z == float("-inf"):
-        return None
+    # Bulk-copy the coordinates once instead of a Python attribute read
+    # per vertex; the reductions then run at C speed.
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    z = co[2::3]
+    min_z = float(z.min())
+    max_z = float(z.max())
     if max_z - min_z <= 1e-8:
         return (min_z, min_z + 1.0)
     return (min_z, max_z)
@@ -233,18 +266,11 @@ def _ensure_planar_uv_xy(
     except Exception:
         tile = _DEFAULT_TERRAIN_UV_TILE_M
 
-    min_x = float("inf")
-    min_y = float("inf")
-    for v in mesh.vertices:
-        x = float(v.co.x)
-        y = float(v.co.y)
-        if x < min_x:
-            min_x = x
-        if y < min_y:
-            min_y = y
-
-    if min_x == float("inf") or min_y == float("inf"):
-        return False
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    co = co.reshape(-1, 3)
+    min_x = float(co[:, 0].min())
+    min_y = float(co[:, 1].min())
 
     created = False
     if not mesh.uv_layers:
@@ -261,14 +287,17 @@ def _ensure_planar_uv_xy(
         pass
 
     try:
-        uv_data = uv_layer.data
+        # Every loop belongs to exactly one polygon, so gathering
+        # vertex indices for all loops covers the same corners as the
+        # old per-polygon Python loop, without per-corner RNA traffic.
         loops = mesh.loops
-        verts = mesh.vertices
-        for poly in mesh.polygons:
-            for li in poly.loop_indices:
-                vi = loops[li].vertex_index
-                co = verts[vi].co
-                uv_data[li].uv = ((float(co.x) - min_x) / tile, (float(co.y) - min_y) / tile)
+        vert_idx = np.empty(len(loops), dtype=np.int32)
+        loops.foreach_get("vertex_index", vert_idx)
+        uvs = co[vert_idx, :2].copy()
+        uvs[:, 0] -= min_x
+        uvs[:, 1] -= min_y
+        uvs /= tile
+        uv_layer.data.foreach_set("uv", uvs.ravel())
     except Exception:
         return False
 
@@ -293,6 +322,8 @@ def _new_node(nt: bpy.types.NodeTree, node_type: str, x: float, y: float) -> bpy
 
 
 def reset_textures_data(*, texture_root: str | None) -> str:
+    _FOLDER_INDEX_CACHE.clear()
+    _CATEGORY_CACHE.clear()
     root = bpy.path.abspath(texture_root) if texture_root else default_texture_root()
     root = os.path.normpath(os.path.normcase(root))
 
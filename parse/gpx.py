@@ -81,23 +81,56 @@ def simplify_polyline(points: list[Vector], min_step_m: float) -> list[Vector]:
 
 
 def simplify_polyline_xy(points: list[Vector], min_step_m: float) -> list[Vector]:
-    if min_step_m <= 0.0 or len(points) <= 2:
+    # Iterative Douglas-Peucker on the XY projection: keeps the points that
+    # deviate more than min_step_m from the simplified shape instead of
+    # decimating by spacing, so corners survive while straights collapse.
+    # An explicit stack avoids recursion and every distance test runs in
+    # squared space against the squared tolerance.
+    n = len(points)
+    if min_step_m <= 0.0 or n <= 2:
         return points[:]
 
-    out = [points[0]]
-    last = points[0]
-    min_step_sq = float(min_step_m) * float(min_step_m)
-    for p in points[1:]:
-        dx = float(p.x - last.x)
-        dy = float(p.y - last.y)
-        if dx * dx + dy * dy >= min_step_sq:
-            out.append(p)
-            last = p
-    dx = float(out[-1].x - points[-1].x)
-    dy = float(out[-1].y - points[-1].y)
-    if dx * dx + dy * dy > 0.000001:
-        out.append(points[-1])
-    return out
+    xs = [float(p.x) for p in points]
+    ys = [float(p.y) for p in points]
+    eps2 = float(min_step_m) * float(min_step_m)
+
+    keep = [False] * n
+    keep[0] = keep[n - 1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        lo, hi = stack.pop()
+        if hi - lo < 2:
+            continue
+        ax = xs[lo]
+        ay = ys[lo]
+        abx = xs[hi] - ax
+        aby = ys[hi] - ay
+        denom = abx * abx + aby * aby
+        inv = 1.0 / denom if denom > 1e-12 else 0.0
+
+        best_d2 = -1.0
+        best_i = -1
+        for i in range(lo + 1, hi):
+            px = xs[i] - ax
+            py = ys[i] - ay
+            t = (px * abx + py * aby) * inv
+            if t < 0.0:
+                t = 0.0
+            elif t > 1.0:
+                t = 1.0
+            dx = px - abx * t
+            dy = py - aby * t
+            d2 = dx * dx + dy * dy
+            if d2 > best_d2:
+                best_d2 = d2
+                best_i = i
+
+        if best_d2 > eps2:
+            keep[best_i] = True
+            stack.append((lo, best_i))
+            stack.append((best_i, hi))
+
+    return [p for i, p in enumerate(points) if keep[i]]
 
 
 def smooth_polyline(points: list[Vector], window_size: int = 1, iterations: int = 1) -> list[Vector]:
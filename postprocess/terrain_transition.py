@@ -178,6 +178,35 @@ def _set_socket_default(node_group: bpy.types.NodeTree, socket_name: str, value)
         return False
 
 
+# Socket identifiers are stable for the lifetime of a node group, but
+# finding one means a linear scan of the interface; cache them per group
+# pointer so repeated modifier updates (e.g. slider drags) hit a dict.
+_socket_ident_cache: dict[tuple[int, str], str] = {}
+
+
+def _input_socket_identifier(
+    ng: bpy.types.NodeTree, socket_name: str, *, refresh: bool = False
+) -> str | None:
+    key = (ng.as_pointer(), socket_name)
+    if not refresh:
+        ident = _socket_ident_cache.get(key)
+        if ident is not None:
+            return ident
+    for item in ng.interface.items_tree:
+        if getattr(item, "item_type", None) != "SOCKET":
+            continue
+        if getattr(item, "in_out", None) != "INPUT":
+            continue
+        if getattr(item, "name", None) != socket_name:
+            continue
+        ident = getattr(item, "identifier", None)
+        if ident:
+            _socket_ident_cache[key] = ident
+            return ident
+    _socket_ident_cache.pop(key, None)
+    return None
+
+
 def _set_modifier_input(mod: bpy.types.Modifier, socket_name: str, value) -> bool:
     try:
         mod[socket_name] = value
@@ -187,20 +216,21 @@ def _set_modifier_input(mod: bpy.types.Modifier, socket_name: str, value) -> boo
 
     ng = getattr(mod, "node_group", None)
     if ng is not None and hasattr(ng, "interface"):
-        for item in ng.interface.items_tree:
-            if getattr(item, "item_type", None) != "SOCKET":
-                continue
-            if getattr(item, "in_out", None) != "INPUT":
-                continue
-            if getattr(item, "name", None) != socket_name:
-                continue
-            ident = getattr(item, "identifier", None)
-            if ident:
-                try:
-                    mod[ident] = value
-                    return True
-                except Exception:
-                    pass
+        ident = _input_socket_identifier(ng, socket_name)
+        if ident is not None:
+            try:
+                mod[ident] = value
+                return True
+            except Exception:
+                # A cached identifier can go stale if the group was rebuilt
+                # at the same address; rescan once before the key fallback.
+                ident = _input_socket_identifier(ng, socket_name, refresh=True)
+                if ident is not None:
+                    try:
+                        mod[ident] = value
+                        return True
+                    except Exception:
+                        pass
 
     for k in mod.keys():
         if str(k).strip().lower() == socket_name.strip().lower():
@@ -212,6 +242,12 @@ def _set_modifier_input(mod: bpy.types.Modifier, socket_name: str, value) -> boo
     return False
 
 
+# Last-applied settings per terrain object, so re-running the apply with
+# unchanged values (idle UI refreshes, presets) skips the modifier writes
+# and their depsgraph invalidation entirely.
+_last_applied: dict[int, tuple] = {}
+
+
 def apply_terrain_transition(
     *,
     terrain_obj: bpy.types.Object,
@@ -230,6 +266,23 @@ def apply_terrain_transition(
         ng = ensure_terrain_transition_node_group()
     except Exception as e:
         return f"Failed to build terrain transition node group: {e}"
+
+    key = terrain_obj.as_pointer()
+    signature = (
+        road_obj.as_pointer(),
+        float(max(0.0, transition_width_m)),
+        float(max(0.0, flat_width_m)),
+        float(max(0.0, clearance_m)),
+        int(max(0, subdivide_levels)),
+    )
+    existing = terrain_obj.modifiers.get(MODIFIER_NAME)
+    if (
+        existing is not None
+        and existing.node_group is ng
+        and _last_applied.get(key) == signature
+    ):
+        return None
+
     _set_socket_default(ng, "Road", road_obj)
     _set_socket_default(ng, "Transition Width (m)", float(max(0.0, transition_width_m)))
     _set_socket_default(ng, "Flat Width (m)", float(max(0.0, flat_width_m)))
@@ -242,11 +295,22 @@ def apply_terrain_transition(
 
     mod.node_group = ng
 
-    _set_modifier_input(mod, "Road", road_obj)
-    _set_modifier_input(mod, "Transition Width (m)", float(max(0.0, transition_width_m)))
-    _set_modifier_input(mod, "Flat Width (m)", float(max(0.0, flat_width_m)))
-    _set_modifier_input(mod, "Clearance (m)", float(max(0.0, clearance_m)))
-    _set_modifier_input(mod, "Subdivide Levels", int(max(0, subdivide_levels)))
+    # Each input write tags the depsgraph; disable the modifier for the
+    # burst so the node tree is evaluated once with all five inputs in
+    # place instead of re-tagged per write.
+    prev_show = mod.show_viewport
+    if prev_show:
+        mod.show_viewport = False
+    try:
+        _set_modifier_input(mod, "Road", road_obj)
+        _set_modifier_input(mod, "Transition Width (m)", float(max(0.0, transition_width_m)))
+        _set_modifier_input(mod, "Flat Width (m)", float(max(0.0, flat_width_m)))
+        _set_modifier_input(mod, "Clearance (m)", float(max(0.0, clearance_m)))
+        _set_modifier_input(mod, "Subdivide Levels", int(max(0, subdivide_levels)))
+    finally:
+        if prev_show:
+            mod.show_viewport = True
+    _last_applied[key] = signature
     return None
 
 
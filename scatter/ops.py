@@ -15,25 +15,27 @@ class ROUTE2WORLD_OT_ScatterRoadsideAssets(bpy.types.Operator):
         s = context.scene.route2world_scatter
 
         def _collection_is_in_tree(root: bpy.types.Collection, target: bpy.types.Collection) -> bool:
-            if root == target:
-                return True
-            for c in root.children:
-                if _collection_is_in_tree(c, target):
+            stack = [root]
+            while stack:
+                c = stack.pop()
+                if c == target:
                     return True
+                stack.extend(c.children)
             return False
 
-        def _layer_collection_path(
+        def _layer_collection_paths(
             root: bpy.types.LayerCollection,
-            target: bpy.types.Collection,
-            acc: list[bpy.types.LayerCollection],
-        ) -> list[bpy.types.LayerCollection] | None:
-            if root.collection == target:
-                return acc + [root]
-            for lc in root.children:
-                found = _layer_collection_path(lc, target, acc + [root])
-                if found:
-                    return found
-            return None
+        ) -> dict[int, list[bpy.types.LayerCollection]]:
+            # One walk of the layer tree; lookups afterwards are O(1) by
+            # collection pointer.
+            paths: dict[int, list[bpy.types.LayerCollection]] = {}
+            stack = [(root, [root])]
+            while stack:
+                lc, path = stack.pop()
+                paths[lc.collection.as_pointer()] = path
+                for child in lc.children:
+                    stack.append((child, path + [child]))
+            return paths
 
         def _ensure_collection_visible(c: bpy.types.Collection) -> None:
             scene_root = context.scene.collection
@@ -42,7 +44,8 @@ class ROUTE2WORLD_OT_ScatterRoadsideAssets(bpy.types.Operator):
                     scene_root.children.link(c)
                 except RuntimeError:
                     pass
-            path = _layer_collection_path(context.view_layer.layer_collection, c, [])
+            paths = _layer_collection_paths(context.view_layer.layer_collection)
+            path = paths.get(c.as_pointer())
             if not path:
                 return
             for lc in path:
@@ -3,10 +3,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 import math
 
+import numpy as np
 from mathutils import Vector
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Bounds2D:
     min_x: float
     min_y: float
@@ -41,22 +42,72 @@ class Bounds2D:
 def bounds_from_points_xy(points: list[Vector]) -> Bounds2D:
     if not points:
         return Bounds2D(0.0, 0.0, 0.0, 0.0)
-    min_x = min(p.x for p in points)
-    max_x = max(p.x for p in points)
-    min_y = min(p.y for p in points)
-    max_y = max(p.y for p in points)
-    return Bounds2D(min_x=min_x, min_y=min_y, max_x=max_x, max_y=max_y)
+    # One pass to extract XY, then C-level min/max reductions instead of
+    # four generator sweeps with per-element attribute lookups.
+    arr = np.asarray([(p.x, p.y) for p in points], dtype=np.float64)
+    min_x, min_y = arr.min(axis=0)
+    max_x, max_y = arr.max(axis=0)
+    return Bounds2D(min_x=float(min_x), min_y=float(min_y), max_x=float(max_x), max_y=float(max_y))
+
+
+def closest_point_on_segment_2d_xy(
+    px: float, py: float, ax: float, ay: float, bx: float, by: float
+) -> tuple[float, float, float]:
+    # Plain-float kernel: no Vector allocations, just locals, so per-call
+    # cost is arithmetic only. Returns (qx, qy, t).
+    abx = bx - ax
+    aby = by - ay
+    denom = abx * abx + aby * aby
+    if denom <= 1e-12:
+        return ax, ay, 0.0
+    t = ((px - ax) * abx + (py - ay) * aby) / denom
+    if t < 0.0:
+        t = 0.0
+    elif t > 1.0:
+        t = 1.0
+    return ax + abx * t, ay + aby * t, t
 
 
 def closest_point_on_segment_2d(p: Vector, a: Vector, b: Vector) -> tuple[Vector, float]:
-    ab = Vector((b.x - a.x, b.y - a.y))
-    ap = Vector((p.x - a.x, p.y - a.y))
-    denom = ab.length_squared
-    if denom <= 1e-12:
-        return Vector((a.x, a.y)), 0.0
-    t = max(0.0, min(1.0, ap.dot(ab) / denom))
-    q = Vector((a.x + ab.x * t, a.y + ab.y * t))
-    return q, t
+    qx, qy, t = closest_point_on_segment_2d_xy(p.x, p.y, a.x, a.y, b.x, b.y)
+    return Vector((qx, qy)), t
+
+
+def closest_points_on_polyline_2d(
+    pxs: np.ndarray,
+    pys: np.ndarray,
+    ax: np.ndarray,
+    ay: np.ndarray,
+    bx: np.ndarray,
+    by: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Batched counterpart of closest_point_on_segment_2d.
+
+    Takes query points and segment endpoints as separate coordinate
+    arrays and returns (qx, qy, d2): the closest point on any segment per
+    query and the squared distance to it. All queries are broadcast
+    against all segments at once, which fits the track sizes this add-on
+    handles; degenerate segments clamp to their start point.
+    """
+    abx = bx - ax
+    aby = by - ay
+    denom = abx * abx + aby * aby
+    safe = denom > 1e-12
+    inv = np.where(safe, 1.0 / np.where(safe, denom, 1.0), 0.0)
+
+    apx = pxs[:, None] - ax[None, :]
+    apy = pys[:, None] - ay[None, :]
+    t = np.clip((apx * abx + apy * aby) * inv, 0.0, 1.0)
+    dx = apx - abx * t
+    dy = apy - aby * t
+    d2 = dx * dx + dy * dy
+
+    j = np.argmin(d2, axis=1)
+    rows = np.arange(pxs.shape[0])
+    t_best = t[rows, j]
+    qx = ax[j] + abx[j] * t_best
+    qy = ay[j] + aby[j] * t_best
+    return qx, qy, d2[rows, j]
 
 
 def smoothstep01(t: float) -> float:
@@ -71,5 +122,14 @@ def smoothstep(edge0: float, edge1: float, x: float) -> float:
     return smoothstep01(t)
 
 
+def smoothstep_np(edge0: float, edge1: float, x: np.ndarray) -> np.ndarray:
+    # Array form of smoothstep for bulk blends; the edges stay scalar, so
+    # the degenerate-edge branch is resolved once instead of per element.
+    if edge0 == edge1:
+        return np.where(x < edge0, 0.0, 1.0)
+    t = np.clip((x - edge0) / (edge1 - edge0), 0.0, 1.0)
+    return t * t * (3.0 - 2.0 * t)
+
+
 def lerp(a: float, b: float, t: float) -> float:
     return a + (b - a) * t